@@ -8,7 +8,9 @@ Usage: python3 scripts/monitor_solve.py /path/to/output.log
 import sys
 import time
 import re
+import sqlite3
 import subprocess
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -31,6 +33,41 @@ except ImportError:
     from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
     from rich.text import Text
 
+try:
+    import psutil
+except ImportError:
+    print("Installing required package 'psutil'...")
+    subprocess.run([sys.executable, "-m", "pip", "install", "psutil", "-q"])
+    import psutil
+
+
+# Log line patterns (compiled once, matched against every new log line)
+_RE_DEPTH_DONE = re.compile(r'Depth (\d+): Generated ([\d,]+) new positions.*total: ([\d,]+)')
+_RE_DEPTH_START = re.compile(r'Depth (\d+): Processing ([\d,]+) positions in chunks')
+_RE_DEPTH_CHUNK = re.compile(
+    r'Depth (\d+) progress: chunk (\d+)/(\d+) \(([\d.]+)%\) - ([\d,]+) new positions'
+)
+_RE_MAX_SEEDS = re.compile(r'Max seeds in pits: (\d+)')
+_RE_SEEDS_SOLVED = re.compile(r'Seeds-in-pits (\d+): solved ([\d,]+) positions in (\d+) iterations')
+_RE_CACHE_SIZE = re.compile(r'adaptive cache size: (\d+)MB')
+_RE_MEM_AVAILABLE = re.compile(r'(\d+\.\d+)GB available')
+
+
+def _pint(s: str) -> int:
+    """Parse a comma-grouped integer like '1,234,567'."""
+    return int(s.replace(',', ''))
+
+
+# Number of recent depths / seed layers shown in the progress table
+HISTORY_ROWS = 10
+
+# Poll interval while log lines are arriving / while the log is quiet (seconds)
+ACTIVE_POLL_INTERVAL = 0.25
+IDLE_POLL_INTERVAL = 1.0
+
+# Rebuild the dashboard at least this often when idle (keeps elapsed time/resources fresh)
+IDLE_REFRESH_INTERVAL = 2.0
+
 
 class SolverMonitor:
     def __init__(self, log_file: str, db_path: str = None):
@@ -54,9 +91,9 @@ class SolverMonitor:
         self.depth_chunk_total = 0
         self.depth_positions_generated = 0
 
-        # History for graphs
-        self.depth_history = []  # [(depth, positions, total)]
-        self.seed_history = []   # [(seeds, positions, iterations)]
+        # History for graphs (bounded to the rows the dashboard shows)
+        self.depth_history = deque(maxlen=HISTORY_ROWS)  # [(depth, positions, total)]
+        self.seed_history = deque(maxlen=HISTORY_ROWS)   # [(seeds, positions, iterations)]
 
         # Resource tracking
         self.db_size = 0
@@ -69,13 +106,46 @@ class SolverMonitor:
         self.adaptive_cache_mb = None
         self.last_memory_state = "Normal"  # "Normal", "Throttled", "Critical"
 
+        # Recent INFO/ERROR lines for the footer (filled by parse_log_line)
+        self.recent_log_lines = deque(maxlen=5)
+
+        # Set whenever parsed state changes; the dashboard is only rebuilt when dirty
+        self._dirty = True
+
+        # Persistent log handle (opened once, reopened if the log is rotated)
+        self._log_fh = None
+        self._log_ino = None
+
         # Database query caching (to avoid hitting DB every refresh)
         self._cached_max_depth = None
         self._last_depth_query = None
+        self._db_conn = None  # Persistent read-only connection (opened on first query)
+
+        # File size / disk usage caching (avoids stat() calls on every refresh)
+        self._cached_db_size = None
+        self._cached_disk_space = None
+        self._last_stat_time = None
+
+        # Python process list caching (process scan refreshes every 5 seconds)
+        self._py_procs = []
+        self._last_proc_scan = None
 
     def parse_log_line(self, line: str):
         """Parse a log line and update state."""
-        # Phase detection
+        # Keep footer tail in memory so the dashboard never re-reads the log
+        if 'INFO' in line or 'ERROR' in line:
+            self.recent_log_lines.append(line.strip())
+            self._dirty = True
+
+        # Cheap substring gate so a handler's regexes only run on lines that can match;
+        # every handler whose key appears runs, in the same order as the original checks
+        for keys, handler in self._DISPATCH:
+            if any(key in line for key in keys):
+                handler(self, line)
+                self._dirty = True
+
+    def _parse_phase_line(self, line: str):
+        """Phase detection and completion."""
         if "PHASE 1" in line and ("Building game graph" in line or "Parallel BFS" in line):
             self.phase = "BFS"
             if not self.start_time:
@@ -87,12 +157,14 @@ class SolverMonitor:
         elif "SOLUTION COMPLETE" in line or "VALIDATION PASSED" in line:
             self.phase = "Complete"
 
-        # BFS progress - final depth completion
-        match = re.search(r'Depth (\d+): Generated ([\d,]+) new positions.*total: ([\d,]+)', line)
+    def _parse_depth_line(self, line: str):
+        """BFS progress."""
+        # Final depth completion
+        match = _RE_DEPTH_DONE.search(line)
         if match:
             self.current_depth = int(match.group(1))
-            positions_at_depth = int(match.group(2).replace(',', ''))
-            self.total_positions = int(match.group(3).replace(',', ''))
+            positions_at_depth = _pint(match.group(2))
+            self.total_positions = _pint(match.group(3))
             self.max_depth = max(self.max_depth, self.current_depth)
             self.depth_history.append((self.current_depth, positions_at_depth, self.total_positions))
             self.last_update = datetime.now()
@@ -102,7 +174,7 @@ class SolverMonitor:
             self.depth_positions_generated = 0
 
         # BFS depth start (captures total positions to process)
-        match = re.search(r'Depth (\d+): Processing ([\d,]+) positions in chunks', line)
+        match = _RE_DEPTH_START.search(line)
         if match:
             self.current_depth = int(match.group(1))
             self.max_depth = max(self.max_depth, self.current_depth)
@@ -112,39 +184,46 @@ class SolverMonitor:
             self.depth_positions_generated = 0
 
         # BFS intra-depth progress (new!)
-        match = re.search(r'Depth (\d+) progress: chunk (\d+)/(\d+) \(([\d.]+)%\) - ([\d,]+) new positions', line)
+        match = _RE_DEPTH_CHUNK.search(line)
         if match:
             depth = int(match.group(1))
             if depth == self.current_depth:  # Only track current depth
                 self.depth_chunk_current = int(match.group(2))
                 self.depth_chunk_total = int(match.group(3))
-                self.depth_positions_generated = int(match.group(5).replace(',', ''))
+                self.depth_positions_generated = _pint(match.group(5))
                 self.last_update = datetime.now()
 
-        # Minimax progress
-        match = re.search(r'Max seeds in pits: (\d+)', line)
+    def _parse_max_seeds_line(self, line: str):
+        """Minimax setup."""
+        match = _RE_MAX_SEEDS.search(line)
         if match:
             self.max_seeds_in_pits = int(match.group(1))
 
-        match = re.search(r'Seeds-in-pits (\d+): solved ([\d,]+) positions in (\d+) iterations', line)
+    def _parse_seeds_line(self, line: str):
+        """Minimax progress."""
+        match = _RE_SEEDS_SOLVED.search(line)
         if match:
             seeds = int(match.group(1))
-            positions = int(match.group(2).replace(',', ''))
+            positions = _pint(match.group(2))
             iterations = int(match.group(3))
             self.current_seeds_in_pits = seeds
             self.seeds_solved = seeds + 1
             self.seed_history.append((seeds, positions, iterations))
             self.last_update = datetime.now()  # Track updates
 
-        # Memory management events
-        if "Using adaptive cache size:" in line:
-            match = re.search(r'adaptive cache size: (\d+)MB', line)
-            if match:
-                self.adaptive_cache_mb = int(match.group(1))
+    def _parse_cache_line(self, line: str):
+        """Adaptive cache size."""
+        match = _RE_CACHE_SIZE.search(line)
+        if match:
+            self.adaptive_cache_mb = int(match.group(1))
 
+    def _parse_dedup_line(self, line: str):
+        """Dedup mode switch."""
         if "switching to DB-based dedup" in line or "DB-based dedup:" in line:
             self.dedup_mode = "DB"
 
+    def _parse_pressure_line(self, line: str):
+        """Memory pressure events."""
         if "Critical memory pressure" in line or "CRITICAL memory pressure" in line:
             self.memory_critical += 1
             self.last_memory_state = "Critical"
@@ -153,17 +232,44 @@ class SolverMonitor:
             self.memory_warnings += 1
             self.last_memory_state = "Throttled"
 
-        # Reset to normal if we see memory recovered
-        if "Memory:" in line and "available" in line:
-            # Check if pressure is back to normal
-            match = re.search(r'(\d+\.\d+)GB available', line)
+    def _parse_memory_line(self, line: str):
+        """Reset to normal if we see memory recovered."""
+        if "available" in line:
+            match = _RE_MEM_AVAILABLE.search(line)
             if match:
                 available_gb = float(match.group(1))
                 if available_gb > 4.0:
                     self.last_memory_state = "Normal"
 
+    # (substrings, handler); each handler runs once if any of its substrings is in the line
+    _DISPATCH = (
+        (('PHASE ', 'SOLUTION COMPLETE', 'VALIDATION PASSED'), _parse_phase_line),
+        (('Depth ',), _parse_depth_line),
+        (('Max seeds in pits',), _parse_max_seeds_line),
+        (('Seeds-in-pits',), _parse_seeds_line),
+        (('adaptive cache size',), _parse_cache_line),
+        (('DB-based dedup',), _parse_dedup_line),
+        (('emory pressure',), _parse_pressure_line),
+        (('Memory:',), _parse_memory_line),
+    )
+
     def get_db_size(self) -> str:
-        """Get database file size."""
+        """Get database file size (cached, refreshes every 2 seconds)."""
+        self._refresh_file_stats()
+        return self._cached_db_size
+
+    def _refresh_file_stats(self):
+        """Re-stat the database file and disk if the cached values are older than 2 seconds."""
+        now = datetime.now()
+        if self._last_stat_time and (now - self._last_stat_time).total_seconds() < 2:
+            return
+
+        self._cached_db_size = self._stat_db_size()
+        self._cached_disk_space = self._stat_disk_space()
+        self._last_stat_time = now
+
+    def _stat_db_size(self) -> str:
+        """Read and format the database file size."""
         if self.db_path and self.db_path.exists():
             size_bytes = self.db_path.stat().st_size
             if size_bytes < 1024**2:
@@ -174,6 +280,26 @@ class SolverMonitor:
                 return f"{size_bytes / 1024**3:.2f} GB"
         return "N/A"
 
+    def _get_db_conn(self) -> sqlite3.Connection:
+        """Get the persistent read-only database connection, opening it if needed."""
+        if self._db_conn is None:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            self._db_conn = sqlite3.connect(uri, uri=True, timeout=1.0, check_same_thread=False)
+            self._db_conn.execute("PRAGMA query_only=1")
+            # Read pages straight from the OS page cache (ignored where mmap is unsupported)
+            self._db_conn.execute("PRAGMA mmap_size=1073741824")  # 1 GiB
+            self._db_conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        return self._db_conn
+
+    def _close_db_conn(self):
+        """Close the read-only database connection if open."""
+        if self._db_conn is not None:
+            try:
+                self._db_conn.close()
+            except:
+                pass
+            self._db_conn = None
+
     def get_db_max_depth(self) -> int:
         """Query database for maximum depth (cached, refreshes every 5 seconds)."""
         if not self.db_path or not self.db_path.exists():
@@ -186,19 +312,22 @@ class SolverMonitor:
 
         # Query database
         try:
-            import sqlite3
-            conn = sqlite3.connect(str(self.db_path), timeout=1.0)
-            cursor = conn.execute("SELECT MAX(depth) FROM positions")
+            cursor = self._get_db_conn().execute("SELECT MAX(depth) FROM positions")
             result = cursor.fetchone()
-            conn.close()
             self._cached_max_depth = result[0] if result and result[0] is not None else None
             self._last_depth_query = now
             return self._cached_max_depth
         except:
+            self._close_db_conn()  # Reopen on next query (e.g. file was replaced)
             return self._cached_max_depth  # Return last known value on error
 
     def get_disk_space(self) -> dict:
-        """Get disk space info for database location."""
+        """Get disk space info for database location (cached with get_db_size)."""
+        self._refresh_file_stats()
+        return self._cached_disk_space
+
+    def _stat_disk_space(self) -> dict:
+        """Read disk usage for the database location."""
         try:
             import shutil
             if self.db_path and self.db_path.exists():
@@ -222,81 +351,45 @@ class SolverMonitor:
             "percent_used": 0,
         }
 
+    def _get_python_processes(self) -> list:
+        """Get Python processes (cached, rescans every 5 seconds)."""
+        now = datetime.now()
+        if self._last_proc_scan and (now - self._last_proc_scan).total_seconds() < 5:
+            return self._py_procs
+
+        self._py_procs = [
+            p for p in psutil.process_iter(['name'])
+            if 'python' in (p.info['name'] or '').lower()
+        ]
+        self._last_proc_scan = now
+        return self._py_procs
+
     def get_resource_usage(self) -> dict:
         """Get system resource usage."""
         try:
-            # Process memory usage
-            result = subprocess.run(
-                ["ps", "-eo", "rss,comm"],
-                capture_output=True,
-                text=True
-            )
-            process_mem_kb = 0
-            for line in result.stdout.split('\n'):
-                if 'python' in line.lower():
-                    mem_kb = int(line.strip().split()[0])
-                    process_mem_kb += mem_kb
-
-            process_mem_mb = process_mem_kb / 1024
-
-            # Total system memory
-            total_mem_result = subprocess.run(
-                ["sysctl", "-n", "hw.memsize"],
-                capture_output=True,
-                text=True
-            )
-            total_mem_bytes = int(total_mem_result.stdout.strip())
-            total_mem_gb = total_mem_bytes / (1024**3)
-
-            # System memory pressure (active + wired)
-            vm_stat = subprocess.run(
-                ["vm_stat"],
-                capture_output=True,
-                text=True
-            )
-
-            pages_free = 0
-            pages_active = 0
-            pages_inactive = 0
-            pages_wired = 0
-            page_size = 4096  # Default page size
-
-            for line in vm_stat.stdout.split('\n'):
-                if 'page size of' in line:
-                    page_size = int(line.split('of')[1].strip().split()[0])
-                elif 'Pages free:' in line:
-                    pages_free = int(line.split(':')[1].strip().rstrip('.'))
-                elif 'Pages active:' in line:
-                    pages_active = int(line.split(':')[1].strip().rstrip('.'))
-                elif 'Pages inactive:' in line:
-                    pages_inactive = int(line.split(':')[1].strip().rstrip('.'))
-                elif 'Pages wired down:' in line:
-                    pages_wired = int(line.split(':')[1].strip().rstrip('.'))
-
-            # Calculate actual memory usage
-            used_mem_bytes = (pages_active + pages_wired) * page_size
-            # Available = Free + Inactive (inactive pages can be reclaimed)
-            available_mem_bytes = (pages_free + pages_inactive) * page_size
-            used_mem_gb = used_mem_bytes / (1024**3)
-            free_mem_gb = available_mem_bytes / (1024**3)
-
-            # Memory pressure percentage
-            memory_pressure = (used_mem_bytes / total_mem_bytes) * 100 if total_mem_bytes > 0 else 0
-
-            # CPU count
-            cpu_count = subprocess.run(
-                ["sysctl", "-n", "hw.ncpu"],
-                capture_output=True,
-                text=True
-            ).stdout.strip()
+            # Process memory usage (all Python processes including workers)
+            process_mem_bytes = 0
+            for proc in self._get_python_processes():
+                try:
+                    process_mem_bytes += proc.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+
+            process_mem_mb = process_mem_bytes / (1024**2)
+
+            # System memory (available already accounts for reclaimable pages)
+            vm = psutil.virtual_memory()
+            total_mem_gb = vm.total / (1024**3)
+            used_mem_gb = (vm.total - vm.available) / (1024**3)
+            free_mem_gb = vm.available / (1024**3)
 
             return {
                 "process_mem_mb": process_mem_mb,
                 "total_mem_gb": total_mem_gb,
                 "used_mem_gb": used_mem_gb,
                 "free_mem_gb": free_mem_gb,
-                "memory_pressure": memory_pressure,
-                "cpu_count": cpu_count,
+                "memory_pressure": vm.percent,
+                "cpu_count": str(psutil.cpu_count()),
             }
         except:
             return {
@@ -511,7 +604,7 @@ class SolverMonitor:
             progress_table.add_column("Positions", style="yellow", justify="right")
             progress_table.add_column("Total", style="green", justify="right")
 
-            for depth, positions, total in self.depth_history[-10:]:
+            for depth, positions, total in self.depth_history:
                 progress_table.add_row(
                     str(depth),
                     f"{positions:,}",
@@ -527,7 +620,7 @@ class SolverMonitor:
             progress_table.add_column("Positions", style="yellow", justify="right")
             progress_table.add_column("Iterations", style="magenta", justify="right")
 
-            for seeds, positions, iterations in self.seed_history[-10:]:
+            for seeds, positions, iterations in self.seed_history:
                 progress_table.add_row(
                     str(seeds),
                     f"{positions:,}",
@@ -538,22 +631,35 @@ class SolverMonitor:
         else:
             layout["progress"].update(Panel("Waiting for data...", border_style="white"))
 
-        # Footer - recent log lines
-        footer_lines = []
-        try:
-            with open(self.log_file, 'r') as f:
-                lines = f.readlines()
-                # Get last 5 log lines (filter out progress bar noise)
-                log_lines = [l.strip() for l in lines if 'INFO' in l or 'ERROR' in l]
-                footer_lines = log_lines[-5:]
-        except:
-            footer_lines = ["Waiting for log file..."]
-
-        footer_text = "\n".join(footer_lines[-5:])
+        # Footer - recent log lines (tracked incrementally by parse_log_line)
+        if self.recent_log_lines:
+            footer_text = "\n".join(self.recent_log_lines)
+        else:
+            footer_text = "Waiting for log file..."
         layout["footer"].update(Panel(footer_text, title="📝 Recent Logs", border_style="white"))
 
         return layout
 
+    def _drain_new_lines(self) -> list:
+        """Read lines appended to the log since the last call."""
+        try:
+            st = self.log_file.stat()
+        except FileNotFoundError:
+            return []
+        ino = st.st_ino
+
+        # (Re)open on first use or when the log file was rotated/replaced
+        if self._log_fh is None or ino != self._log_ino:
+            if self._log_fh is not None:
+                self._log_fh.close()
+            self._log_fh = open(self.log_file, 'r')
+            self._log_ino = ino
+        elif st.st_size < self._log_fh.tell():
+            # Truncated in place: start over from the beginning
+            self._log_fh.seek(0)
+
+        return self._log_fh.readlines()
+
     def monitor(self):
         """Main monitoring loop."""
         self.console.print("[bold green]Starting Mancala Solver Monitor...[/bold green]")
@@ -565,33 +671,34 @@ class SolverMonitor:
         time.sleep(1)
 
         with Live(self.create_dashboard(), refresh_per_second=2, console=self.console) as live:
-            file_pos = 0
+            last_render = time.monotonic()
             try:
                 while True:
                     # Read new lines from log
-                    try:
-                        with open(self.log_file, 'r') as f:
-                            f.seek(file_pos)
-                            new_lines = f.readlines()
-                            file_pos = f.tell()
-
-                            for line in new_lines:
-                                self.parse_log_line(line)
-                    except FileNotFoundError:
-                        pass
+                    for line in self._drain_new_lines():
+                        self.parse_log_line(line)
 
-                    # Update display
-                    live.update(self.create_dashboard())
+                    # Update display only when state changed (or periodically when idle)
+                    was_dirty = self._dirty
+                    if was_dirty or time.monotonic() - last_render >= IDLE_REFRESH_INTERVAL:
+                        live.update(self.create_dashboard())
+                        last_render = time.monotonic()
+                        self._dirty = False
 
                     # Check if complete
                     if self.phase == "Complete":
                         time.sleep(5)
                         break
 
-                    time.sleep(0.5)
+                    time.sleep(ACTIVE_POLL_INTERVAL if was_dirty else IDLE_POLL_INTERVAL)
 
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Monitoring stopped by user[/yellow]")
+            finally:
+                self._close_db_conn()
+                if self._log_fh is not None:
+                    self._log_fh.close()
+                    self._log_fh = None
 
 
 def main():
@@ -5,16 +5,11 @@ Test chunked solver on Cloud SQL.
 This validates the chunked architecture before scaling to Kalah(6,4).
 """
 
-import sys
 import logging
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from src.mancala_solver.storage import PostgreSQLBackend
-from src.mancala_solver.solver import ChunkedBFSSolver, ChunkedParallelMinimaxSolver
-from src.mancala_solver.core import init_zobrist_table
+from mancala_solver.storage import PostgreSQLBackend
+from mancala_solver.solver import ChunkedBFSSolver, ParallelMinimaxSolver
+from mancala_solver.core import init_zobrist_table
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +19,8 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+HR = "=" * 60
+
 
 def main():
     # Configuration
@@ -32,11 +29,11 @@ def main():
     CHUNK_SIZE = 10_000  # Small chunks for testing
     NUM_WORKERS = 14
 
-    logger.info("=" * 60)
+    logger.info(HR)
     logger.info("CHUNKED SOLVER TEST - Kalah(4,3)")
-    logger.info("=" * 60)
+    logger.info(HR)
     logger.info(f"Chunk size: {CHUNK_SIZE:,}")
-    logger.info(f"Workers: {NUM_WORKERS}")
+    logger.info("Workers: %s", NUM_WORKERS)
 
     # Initialize Zobrist hashing
     init_zobrist_table(NUM_PITS)
@@ -54,7 +51,6 @@ def main():
 
     # Clear existing data
     logger.info("Clearing existing data...")
-    import psycopg2
     with storage.conn.cursor() as cursor:
         cursor.execute("TRUNCATE TABLE positions")
     storage.conn.commit()
@@ -62,9 +58,9 @@ def main():
 
     try:
         # Phase 1: Chunked BFS
-        logger.info("=" * 60)
+        logger.info(HR)
         logger.info("PHASE 1: Chunked BFS")
-        logger.info("=" * 60)
+        logger.info(HR)
 
         bfs_solver = ChunkedBFSSolver(
             storage=storage,
@@ -77,32 +73,32 @@ def main():
 
         logger.info(f"✅ BFS complete: {total_positions:,} positions")
 
-        # Phase 2: Chunked Parallel Minimax
-        logger.info("=" * 60)
-        logger.info("PHASE 2: Chunked Parallel Minimax")
-        logger.info("=" * 60)
+        # Phase 2: Parallel Minimax
+        logger.info(HR)
+        logger.info("PHASE 2: Parallel Minimax")
+        logger.info(HR)
 
-        minimax_solver = ChunkedParallelMinimaxSolver(
+        minimax_solver = ParallelMinimaxSolver(
             storage=storage,
             num_pits=NUM_PITS,
             num_seeds=NUM_SEEDS,
-            chunk_size=CHUNK_SIZE,
+            batch_size=CHUNK_SIZE,
             num_workers=NUM_WORKERS
         )
 
         starting_value = minimax_solver.solve()
 
         # Results
-        logger.info("=" * 60)
+        logger.info(HR)
         logger.info("SOLUTION COMPLETE")
-        logger.info("=" * 60)
+        logger.info(HR)
         logger.info(f"Total positions: {total_positions:,}")
-        logger.info(f"Starting value: {starting_value}")
+        logger.info("Starting value: %s", starting_value)
 
         if starting_value > 0:
-            logger.info(f"Result: Player 1 wins by {starting_value}")
+            logger.info("Result: Player 1 wins by %s", starting_value)
         elif starting_value < 0:
-            logger.info(f"Result: Player 2 wins by {-starting_value}")
+            logger.info("Result: Player 2 wins by %s", -starting_value)
         else:
             logger.info("Result: Perfect play leads to a tie")
 
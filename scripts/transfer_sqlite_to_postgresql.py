@@ -9,24 +9,177 @@ Usage:
         --pg-port 5433 \
         --pg-database mancala \
         --pg-user postgres \
-        --pg-password mancala-first-solve
+        --pg-password mancala-first-solve \
+        --parallelism 8
 """
 
 import argparse
+import io
+import multiprocessing
+import queue
 import sqlite3
+import struct
+import threading
 import psycopg2
-import psycopg2.extras
 from tqdm import tqdm
 
 
-def transfer(sqlite_path, pg_host, pg_port, pg_database, pg_user, pg_password, batch_size=10000):
-    """Transfer all positions from SQLite to PostgreSQL."""
+COPY_SQL = """
+    COPY positions (state_hash, state, depth, seeds_in_pits, minimax_value, best_move)
+    FROM STDIN WITH (FORMAT binary)
+"""
+
+# Secondary indexes are dropped for the bulk load and rebuilt afterwards
+SECONDARY_INDEXES = {
+    "idx_depth_hash": "CREATE INDEX IF NOT EXISTS idx_depth_hash ON positions(depth, state_hash)",
+    "idx_seeds_in_pits": "CREATE INDEX IF NOT EXISTS idx_seeds_in_pits ON positions(seeds_in_pits)",
+}
+# Superseded indexes that may still exist on older databases (dropped, not rebuilt)
+LEGACY_INDEXES = ("idx_depth",)
+
+# Binary COPY framing: signature, flags, header extension length / end-of-data marker
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_TRAILER = struct.pack(">h", -1)
+
+# Field count + state_hash (BIGINT), then length of the state BYTEA
+_ROW_PREFIX = struct.Struct(">hiqi")
+# depth (INTEGER) + seeds_in_pits (SMALLINT)
+_ROW_DEPTH_SEEDS = struct.Struct(">iiih")
+_SMALLINT = struct.Struct(">ih")
+_NULL = struct.pack(">i", -1)
+
+_UINT64_TO_INT64 = 1 << 64
+_INT64_MAX = (1 << 63) - 1
+
+# Encoded chunks buffered between the SQLite reader thread and the COPY writer
+READ_AHEAD = 4
+
+# Rowid shards per worker in parallel mode (finer shards = smoother progress/balance)
+SHARDS_PER_WORKER = 16
+
+SELECT_SQL = "SELECT state_hash, state, depth, seeds_in_pits, minimax_value, best_move FROM positions"
+
+
+def _signed_hash(value) -> int:
+    """SQLite state_hash (unsigned, TEXT or INTEGER) -> signed int64 for BIGINT."""
+    h = int(value)
+    return h - _UINT64_TO_INT64 if h > _INT64_MAX else h
+
+
+def _pack_row(state_hash, state, depth, seeds_in_pits, minimax_value, best_move):
+    """Encode one positions row in PostgreSQL binary COPY format."""
+    parts = [
+        _ROW_PREFIX.pack(6, 8, state_hash, len(state)),
+        state,
+        _ROW_DEPTH_SEEDS.pack(4, depth, 2, seeds_in_pits),
+        _NULL if minimax_value is None else _SMALLINT.pack(2, minimax_value),
+        _NULL if best_move is None else _SMALLINT.pack(2, best_move),
+    ]
+    return b"".join(parts)
+
+
+def _encode_batches(sqlite_cursor):
+    """Yield (encoded COPY chunk, row count) for each fetchmany batch."""
+    while True:
+        rows = sqlite_cursor.fetchmany()
+        if not rows:
+            return
+        yield b"".join([
+            _pack_row(_signed_hash(state_hash), state, depth, seeds, mv, bm)
+            for state_hash, state, depth, seeds, mv, bm in rows
+        ]), len(rows)
+
+
+def _read_chunks(sqlite_cursor, out: queue.Queue):
+    """Reader thread: fetch and encode SQLite batches, then signal EOF with None."""
+    try:
+        for item in _encode_batches(sqlite_cursor):
+            out.put(item)
+    except BaseException as e:
+        out.put(e)
+        return
+    out.put(None)
+
+
+class _ChunkStream(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks (for copy_expert)."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+def _copy_shard(job):
+    """Pool worker: COPY one rowid range of the SQLite table on its own connections."""
+    sqlite_path, pg_params, lo, hi, batch_size = job
+
+    # Read-only URI: concurrent readers never contend for the write lock
+    sqlite_conn = sqlite3.connect(f"file:{sqlite_path}?mode=ro", uri=True)
+    sqlite_cursor = sqlite_conn.cursor()
+    sqlite_cursor.arraysize = batch_size
+    sqlite_cursor.execute(SELECT_SQL + " WHERE rowid BETWEEN ? AND ?", (lo, hi))
+
+    def chunks():
+        yield _COPY_HEADER
+        for chunk, _ in _encode_batches(sqlite_cursor):
+            yield chunk
+        yield _COPY_TRAILER
+
+    pg_conn = psycopg2.connect(**pg_params)
+    try:
+        with pg_conn.cursor() as cursor:
+            cursor.execute("SET LOCAL synchronous_commit = off")
+            cursor.copy_expert(COPY_SQL, _ChunkStream(chunks()), size=1 << 20)
+            copied = cursor.rowcount  # rows loaded, as reported by the server
+        pg_conn.commit()
+    finally:
+        pg_conn.close()
+        sqlite_conn.close()
+
+    return copied
+
+
+def _rowid_shards(sqlite_cursor, num_shards):
+    """Split the SQLite rowid range into num_shards contiguous (lo, hi) ranges."""
+    sqlite_cursor.execute("SELECT MIN(rowid), MAX(rowid) FROM positions")
+    lo, hi = sqlite_cursor.fetchone()
+    if lo is None:
+        return []
+    step = max(1, -(-(hi - lo + 1) // num_shards))
+    return [(start, min(start + step - 1, hi)) for start in range(lo, hi + 1, step)]
+
+
+def transfer(sqlite_path, pg_host, pg_port, pg_database, pg_user, pg_password, batch_size=10000,
+             parallelism=1):
+    """
+    Transfer all positions from SQLite to PostgreSQL.
+
+    With parallelism > 1 the SQLite rowid range is sharded across a process
+    pool, each worker running its own COPY. The table is then cleared in a
+    separate, committed transaction first (concurrent COPYs would block on
+    the TRUNCATE lock), so a failed parallel load is not rolled back.
+    """
 
     # Connect to SQLite
     print(f"📂 Connecting to SQLite: {sqlite_path}")
-    sqlite_conn = sqlite3.connect(sqlite_path)
-    sqlite_conn.row_factory = sqlite3.Row
+    # The cursor is drained from a reader thread once the count below is done
+    sqlite_conn = sqlite3.connect(sqlite_path, check_same_thread=False)
     sqlite_cursor = sqlite_conn.cursor()
+    sqlite_cursor.arraysize = batch_size
 
     # Count total positions
     sqlite_cursor.execute("SELECT COUNT(*) FROM positions")
@@ -44,73 +197,73 @@ def transfer(sqlite_path, pg_host, pg_port, pg_database, pg_user, pg_password, b
     )
     pg_conn.autocommit = False
 
-    # Clear existing data
-    print("🗑️  Clearing existing PostgreSQL data...")
-    with pg_conn.cursor() as cursor:
-        cursor.execute("TRUNCATE TABLE positions")
-    pg_conn.commit()
+    cursor = pg_conn.cursor()
+    drop_and_truncate = (
+        "DROP INDEX IF EXISTS " + ", ".join([*SECONDARY_INDEXES, *LEGACY_INDEXES]) + ";"
+        " TRUNCATE TABLE positions;"
+    )
 
-    # Transfer in batches
-    print(f"📦 Transferring in batches of {batch_size:,}...")
-    sqlite_cursor.execute("SELECT * FROM positions")
-
-    batch = []
-    transferred = 0
-
-    with tqdm(total=total_positions, unit="pos") as pbar:
-        for row in sqlite_cursor:
-            # Convert SQLite row to tuple
-            batch.append((
-                int(row['state_hash']),  # Convert TEXT back to int
-                row['state'],
-                row['depth'],
-                row['seeds_in_pits'],
-                row['minimax_value'],
-                row['best_move']
-            ))
-
-            if len(batch) >= batch_size:
-                # Bulk insert
-                with pg_conn.cursor() as cursor:
-                    psycopg2.extras.execute_values(
-                        cursor,
-                        """
-                        INSERT INTO positions
-                        (state_hash, state, depth, seeds_in_pits, minimax_value, best_move)
-                        VALUES %s
-                        """,
-                        batch,
-                        page_size=1000
-                    )
-                pg_conn.commit()
-
-                transferred += len(batch)
-                pbar.update(len(batch))
-                batch = []
-
-    # Insert remaining
-    if batch:
-        with pg_conn.cursor() as cursor:
-            psycopg2.extras.execute_values(
-                cursor,
-                """
-                INSERT INTO positions
-                (state_hash, state, depth, seeds_in_pits, minimax_value, best_move)
-                VALUES %s
-                """,
-                batch,
-                page_size=1000
-            )
+    if parallelism > 1:
+        print("🗑️  Clearing existing PostgreSQL data...")
+        cursor.execute(drop_and_truncate)
         pg_conn.commit()
-        transferred += len(batch)
-        pbar.update(len(batch))
 
-    # Verify
-    print("✅ Verifying transfer...")
-    with pg_conn.cursor() as cursor:
-        cursor.execute("SELECT COUNT(*) FROM positions")
-        pg_count = cursor.fetchone()[0]
+        shards = _rowid_shards(sqlite_cursor, parallelism * SHARDS_PER_WORKER)
+        pg_params = dict(host=pg_host, port=pg_port, database=pg_database,
+                         user=pg_user, password=pg_password)
+        jobs = [(sqlite_path, pg_params, lo, hi, batch_size) for lo, hi in shards]
+
+        print(f"📦 Transferring via {parallelism} parallel COPYs ({len(jobs)} shards)...")
+        pg_count = 0
+        with multiprocessing.Pool(parallelism) as pool, \
+                tqdm(total=total_positions, unit="pos") as pbar:
+            for copied in pool.imap_unordered(_copy_shard, jobs):
+                pbar.update(copied)
+                pg_count += copied
+    else:
+        # Clear, load and reindex in one transaction: a failed load rolls back to
+        # the previous table contents, and the whole run commits only once.
+        print("🗑️  Clearing existing PostgreSQL data...")
+        # Secondary indexes are dropped so COPY doesn't maintain them row by row
+        cursor.execute(drop_and_truncate + " SET LOCAL synchronous_commit = off;")
+
+        # Stream everything through a single binary COPY
+        print(f"📦 Transferring via COPY in chunks of {batch_size:,}...")
+        sqlite_cursor.execute(SELECT_SQL)
+
+        # Overlap SQLite reads with PostgreSQL writes
+        pending = queue.Queue(maxsize=READ_AHEAD)
+        reader = threading.Thread(target=_read_chunks, args=(sqlite_cursor, pending), daemon=True)
+        reader.start()
 
+        with tqdm(total=total_positions, unit="pos") as pbar:
+
+            def chunks():
+                yield _COPY_HEADER
+                while True:
+                    item = pending.get()
+                    if item is None:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    chunk, n = item
+                    yield chunk
+                    pbar.update(n)
+                yield _COPY_TRAILER
+
+            cursor.copy_expert(COPY_SQL, _ChunkStream(chunks()), size=1 << 20)
+            pg_count = cursor.rowcount
+        reader.join()
+
+    # Rebuild secondary indexes in one pass each
+    print("🔨 Rebuilding indexes...")
+    cursor.execute("; ".join(SECONDARY_INDEXES.values()))
+    pg_conn.commit()
+    cursor.close()
+
+    # Verify against the row counts COPY reported (the table was empty
+    # beforehand, so no COUNT(*) scan over the loaded table is needed)
+    print("✅ Verifying transfer...")
     print(f"📊 SQLite:     {total_positions:,} positions")
     print(f"📊 PostgreSQL: {pg_count:,} positions")
 
@@ -133,6 +286,8 @@ def main():
     parser.add_argument("--pg-user", required=True, help="PostgreSQL user")
     parser.add_argument("--pg-password", required=True, help="PostgreSQL password")
     parser.add_argument("--batch-size", type=int, default=10000, help="Batch size for transfer")
+    parser.add_argument("--parallelism", type=int, default=1,
+                        help="Number of concurrent COPY workers (1 = single transaction)")
 
     args = parser.parse_args()
 
@@ -143,7 +298,8 @@ def main():
         pg_database=args.pg_database,
         pg_user=args.pg_user,
         pg_password=args.pg_password,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        parallelism=args.parallelism,
     )
 
 
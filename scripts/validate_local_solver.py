@@ -2,107 +2,227 @@
 """
 Validate local solver on Kalah(4,3).
 
-This tests the full pipeline:
-1. Parallel BFS (14 workers)
+This tests the full pipeline against a local PostgreSQL database:
+1. Chunked parallel BFS (14 workers)
 2. Parallel Minimax (14 workers)
 3. Verify result matches previous solve
 """
 
+import argparse
+import hashlib
+import os
 import sys
 import time
 import logging
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import mancala_solver
 
-from src.mancala_solver.storage import SQLiteBackend
-from src.mancala_solver.solver import ParallelSolver, ParallelMinimaxSolver
-from src.mancala_solver.core import init_zobrist_table, create_starting_state, zobrist_hash
+from mancala_solver.storage import PostgreSQLBackend
+from mancala_solver.solver import ChunkedBFSSolver, ParallelMinimaxSolver
+from mancala_solver.core import init_zobrist_table, create_starting_state, zobrist_hash
+from mancala_solver.cli.main import setup_logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    force=True,  # Force reconfiguration
-)
-
-# Ensure logs flush immediately (important for monitoring)
-for handler in logging.root.handlers:
-    handler.flush = lambda: None  # Already goes to stderr which is unbuffered
+setup_logging()
 
 logger = logging.getLogger(__name__)
 
+BANNER = "=" * 70
+
+# Source files whose changes invalidate each phase's output
+PACKAGE_DIR = Path(mancala_solver.__file__).parent
+MINIMAX_SOURCES = ["solver/parallel_minimax.py"]
+
+
+def _fingerprint(paths) -> int:
+    """blake2b of the given source files, folded to a positive 31-bit int."""
+    digest = hashlib.blake2b(digest_size=4)
+    for path in sorted(paths):
+        digest.update(path.read_bytes())
+    return int.from_bytes(digest.digest(), "big") & 0x7FFFFFFF
+
+
+def source_fingerprints():
+    """(bfs, minimax) fingerprints: core/ affects both, solver/ is split by phase."""
+    core = list(PACKAGE_DIR.glob("core/*.py"))
+    minimax = [PACKAGE_DIR / name for name in MINIMAX_SOURCES]
+    bfs = [p for p in PACKAGE_DIR.glob("solver/*.py") if p not in minimax]
+    return _fingerprint(core + bfs), _fingerprint(core + minimax)
+
+
+def _ensure_fingerprint_table(storage: PostgreSQLBackend) -> None:
+    """Phase fingerprints live next to the positions table they describe."""
+    with storage.conn.cursor() as cursor:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS validation_fingerprints (
+                phase TEXT PRIMARY KEY,
+                fingerprint BIGINT NOT NULL
+            )
+            """
+        )
+    storage.flush()
+
+
+def read_db_fingerprints(storage: PostgreSQLBackend):
+    """Stored (bfs, minimax) fingerprints; 0 for a phase never completed."""
+    with storage.conn.cursor() as cursor:
+        cursor.execute("SELECT phase, fingerprint FROM validation_fingerprints")
+        stored = dict(cursor.fetchall())
+    return stored.get("bfs", 0), stored.get("minimax", 0)
+
+
+def write_db_fingerprint(storage: PostgreSQLBackend, phase: str, value: int) -> None:
+    """Record a completed phase's fingerprint."""
+    with storage.conn.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO validation_fingerprints (phase, fingerprint) VALUES (%s, %s)
+            ON CONFLICT (phase) DO UPDATE SET fingerprint = EXCLUDED.fingerprint
+            """,
+            (phase, value),
+        )
+    storage.flush()
+
+
+def clear_db_fingerprint(storage: PostgreSQLBackend, *phases: str) -> None:
+    """Forget phases before rerunning them, so a crash can't leave a stale match."""
+    with storage.conn.cursor() as cursor:
+        cursor.execute("DELETE FROM validation_fingerprints WHERE phase = ANY(%s)", (list(phases),))
+    storage.flush()
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Validate local solver on Kalah(4,3)")
+    parser.add_argument(
+        "--phase",
+        choices=["auto", "bfs", "minimax"],
+        default="auto",
+        help="auto: rerun only phases whose sources changed; "
+        "bfs: rerun both phases; minimax: keep BFS output, rerun minimax",
+    )
+    parser.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        help="Clear the positions table and rerun everything (same as --phase bfs)",
+    )
+    parser.add_argument("--pg-host", default="localhost", help="PostgreSQL host")
+    parser.add_argument("--pg-port", type=int, default=5432, help="PostgreSQL port")
+    parser.add_argument(
+        "--pg-database", default="kalah_4_3_validate", help="PostgreSQL database name"
+    )
+    parser.add_argument("--pg-user", default=os.getenv("USER", "postgres"), help="PostgreSQL user")
+    parser.add_argument("--pg-password", default="", help="PostgreSQL password")
+    args = parser.parse_args()
+
     # Configuration
     NUM_PITS = 4
     NUM_SEEDS = 3
     NUM_WORKERS = 14
-    DB_PATH = "data/databases/kalah_4_3_validate.db"
     
-    logger.info("=" * 70)
+    logger.info(BANNER)
     logger.info("LOCAL SOLVER VALIDATION - Kalah(4,3)")
-    logger.info("=" * 70)
-    logger.info(f"Workers: {NUM_WORKERS}")
-    logger.info(f"Database: {DB_PATH}")
+    logger.info(BANNER)
+    logger.info("Workers: %s", NUM_WORKERS)
+    logger.info("Database: %s:%s/%s", args.pg_host, args.pg_port, args.pg_database)
     logger.info("")
     
     # Initialize
     init_zobrist_table(NUM_PITS)
     
-    # Create fresh database
-    db_path = Path(DB_PATH)
-    if db_path.exists():
-        logger.info("Removing old database...")
-        db_path.unlink()
-    
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    storage = SQLiteBackend(str(db_path))
-    
+    storage = PostgreSQLBackend(
+        host=args.pg_host,
+        port=args.pg_port,
+        database=args.pg_database,
+        user=args.pg_user,
+        password=args.pg_password,
+    )
+
     try:
+        _ensure_fingerprint_table(storage)
+
+        # Decide which phases need to run
+        bfs_fp, minimax_fp = source_fingerprints()
+        stored_bfs_fp, stored_minimax_fp = read_db_fingerprints(storage)
+
+        run_bfs = args.force_rebuild or args.phase == "bfs" or stored_bfs_fp != bfs_fp
+        run_minimax = run_bfs or args.phase == "minimax" or stored_minimax_fp != minimax_fp
+
         start_time = time.time()
         
         # Phase 1: Parallel BFS
-        logger.info("=" * 70)
+        logger.info(BANNER)
         logger.info("PHASE 1: Parallel BFS")
-        logger.info("=" * 70)
-        
+        logger.info(BANNER)
+
         bfs_start = time.time()
-        bfs_solver = ParallelSolver(
-            storage=storage,
-            num_pits=NUM_PITS,
-            num_seeds=NUM_SEEDS,
-            num_workers=NUM_WORKERS,
-        )
-        
-        total_positions = bfs_solver.build_game_graph()
+        if run_bfs:
+            # BFS output is stale: start from an empty table
+            logger.info("Clearing old positions...")
+            clear_db_fingerprint(storage, "bfs", "minimax")
+            with storage.conn.cursor() as cursor:
+                cursor.execute("TRUNCATE TABLE positions")
+            storage.drop_minimax_indexes()
+
+            bfs_solver = ChunkedBFSSolver(
+                storage=storage,
+                num_pits=NUM_PITS,
+                num_seeds=NUM_SEEDS,
+                num_workers=NUM_WORKERS,
+            )
+
+            total_positions = bfs_solver.build_game_graph()
+            storage.create_minimax_indexes()
+            storage.analyze()
+            write_db_fingerprint(storage, "bfs", bfs_fp)
+        else:
+            logger.info("BFS sources unchanged - reusing existing positions")
+            total_positions = storage.count_positions()
         bfs_time = time.time() - bfs_start
         
         logger.info("")
-        logger.info(f"✅ BFS Complete")
+        logger.info("✅ BFS Complete")
         logger.info(f"   Positions: {total_positions:,}")
-        logger.info(f"   Time: {bfs_time:.1f}s")
+        logger.info("   Time: %.1fs", bfs_time)
         logger.info("")
         
         # Phase 2: Parallel Minimax
-        logger.info("=" * 70)
+        logger.info(BANNER)
         logger.info("PHASE 2: Parallel Minimax")
-        logger.info("=" * 70)
-        
+        logger.info(BANNER)
+
         minimax_start = time.time()
-        minimax_solver = ParallelMinimaxSolver(
-            storage=storage,
-            num_pits=NUM_PITS,
-            num_seeds=NUM_SEEDS,
-            num_workers=NUM_WORKERS,
-        )
-        
-        starting_value = minimax_solver.solve()
+        if run_minimax:
+            # The solver only fills in unsolved rows, so a rerun over kept
+            # BFS output must clear the previous values first
+            clear_db_fingerprint(storage, "minimax")
+            with storage.conn.cursor() as cursor:
+                cursor.execute(
+                    "UPDATE positions SET minimax_value = NULL, best_move = NULL "
+                    "WHERE minimax_value IS NOT NULL"
+                )
+            storage.flush()
+
+            minimax_solver = ParallelMinimaxSolver(
+                storage=storage,
+                num_pits=NUM_PITS,
+                num_seeds=NUM_SEEDS,
+                num_workers=NUM_WORKERS,
+            )
+
+            starting_value = minimax_solver.solve()
+            storage.flush()
+            write_db_fingerprint(storage, "minimax", minimax_fp)
+        else:
+            logger.info("Minimax sources unchanged - reusing stored values")
+            starting_value = storage.get(
+                zobrist_hash(create_starting_state(NUM_PITS, NUM_SEEDS))
+            ).minimax_value
         minimax_time = time.time() - minimax_start
         
         logger.info("")
-        logger.info(f"✅ Minimax Complete")
-        logger.info(f"   Time: {minimax_time:.1f}s")
+        logger.info("✅ Minimax Complete")
+        logger.info("   Time: %.1fs", minimax_time)
         logger.info("")
         
         # Get best move
@@ -113,16 +233,16 @@ def main():
         total_time = time.time() - start_time
         
         # Results
-        logger.info("=" * 70)
+        logger.info(BANNER)
         logger.info("VALIDATION RESULTS")
-        logger.info("=" * 70)
+        logger.info(BANNER)
         logger.info(f"Total Positions: {total_positions:,}")
-        logger.info(f"Starting Value:  {starting_value}")
-        logger.info(f"Best Move:       Pit {start_pos.best_move}")
+        logger.info("Starting Value:  %s", starting_value)
+        logger.info("Best Move:       Pit %s", start_pos.best_move)
         logger.info("")
-        logger.info(f"Phase 1 (BFS):     {bfs_time:.1f}s")
-        logger.info(f"Phase 2 (Minimax): {minimax_time:.1f}s")
-        logger.info(f"Total Time:        {total_time:.1f}s")
+        logger.info("Phase 1 (BFS):     %.1fs", bfs_time)
+        logger.info("Phase 2 (Minimax): %.1fs", minimax_time)
+        logger.info("Total Time:        %.1fs", total_time)
         logger.info("")
         
         # Validate against known results
@@ -135,25 +255,25 @@ def main():
         if total_positions == EXPECTED_POSITIONS:
             logger.info(f"✅ Position count correct: {total_positions:,}")
         else:
-            logger.error(f"❌ Position count mismatch!")
+            logger.error("❌ Position count mismatch!")
             logger.error(f"   Expected: {EXPECTED_POSITIONS:,}")
             logger.error(f"   Got:      {total_positions:,}")
             success = False
         
         if starting_value == EXPECTED_VALUE:
-            logger.info(f"✅ Starting value correct: {starting_value}")
+            logger.info("✅ Starting value correct: %s", starting_value)
         else:
-            logger.error(f"❌ Starting value mismatch!")
-            logger.error(f"   Expected: {EXPECTED_VALUE}")
-            logger.error(f"   Got:      {starting_value}")
+            logger.error("❌ Starting value mismatch!")
+            logger.error("   Expected: %s", EXPECTED_VALUE)
+            logger.error("   Got:      %s", starting_value)
             success = False
         
         if start_pos.best_move == EXPECTED_MOVE:
-            logger.info(f"✅ Best move correct: Pit {start_pos.best_move}")
+            logger.info("✅ Best move correct: Pit %s", start_pos.best_move)
         else:
-            logger.error(f"❌ Best move mismatch!")
-            logger.error(f"   Expected: Pit {EXPECTED_MOVE}")
-            logger.error(f"   Got:      Pit {start_pos.best_move}")
+            logger.error("❌ Best move mismatch!")
+            logger.error("   Expected: Pit %s", EXPECTED_MOVE)
+            logger.error("   Got:      Pit %s", start_pos.best_move)
             success = False
         
         logger.info("")
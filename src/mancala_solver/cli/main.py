@@ -3,26 +3,52 @@ Main CLI for Mancala solver.
 """
 
 import argparse
+import atexit
 import logging
+import multiprocessing
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-from ..storage import PostgreSQLBackend
-from ..solver import ChunkedBFSSolver, ParallelMinimaxSolver
+# Storage and solver modules (psycopg2, numpy, multiprocessing pools) are
+# imported inside each command so --help and argument errors stay fast.
+
+# Divider line for phase banners in the log
+HR = "=" * 60
 
 
 def setup_logging(level: str = "INFO") -> None:
-    """Configure logging."""
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    """
+    Configure logging.
+
+    Log calls only enqueue the record; a single listener thread formats and
+    writes to stderr. The queue is a multiprocessing.Queue so forked worker
+    processes inherit a working handler too.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
     )
 
+    log_queue = multiprocessing.Queue(-1)
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)  # drains remaining records on exit
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper()))
+    root.handlers[:] = [QueueHandler(log_queue)]
+
 
 def solve_command(args):
     """Solve a Kalah variant using PostgreSQL."""
+    from ..storage import PostgreSQLBackend
+    from ..solver import ChunkedBFSSolver, ParallelMinimaxSolver
+
     setup_logging(args.log_level)
     logger = logging.getLogger(__name__)
 
@@ -30,20 +56,30 @@ def solve_command(args):
     bfs_workers = args.bfs_workers if args.bfs_workers is not None else args.workers
     minimax_workers = args.minimax_workers if args.minimax_workers is not None else args.workers
 
-    logger.info(f"Solving Kalah({args.num_pits},{args.num_seeds})")
-    logger.info(f"BFS workers: {bfs_workers}, Minimax workers: {minimax_workers}")
+    logger.info("Solving Kalah(%s,%s)", args.num_pits, args.num_seeds)
+    logger.info("BFS workers: %s, Minimax workers: %s", bfs_workers, minimax_workers)
 
     # Initialize PostgreSQL storage
-    logger.info(f"Backend: PostgreSQL ({args.pg_host}:{args.pg_port}/{args.pg_database})")
+    logger.info("Backend: PostgreSQL (%s:%s/%s)", args.pg_host, args.pg_port, args.pg_database)
     storage = PostgreSQLBackend(
         host=args.pg_host,
         port=args.pg_port,
         database=args.pg_database,
         user=args.pg_user,
         password=args.pg_password,
+        work_mem=args.pg_work_mem,
+        synchronous_commit=args.pg_synchronous_commit,
     )
 
     try:
+        if args.defer_indexes:
+            # Build idx_seeds_in_pits once after BFS instead of row by row
+            logger.info("Dropping minimax indexes until BFS completes")
+            storage.drop_minimax_indexes()
+        else:
+            logger.info("Building minimax indexes before BFS")
+            storage.create_minimax_indexes()
+
         # Phase 1: Chunked BFS
         logger.info("Using chunked parallel BFS solver (memory-efficient, async writes)")
         bfs_solver = ChunkedBFSSolver(
@@ -51,18 +87,27 @@ def solve_command(args):
             num_pits=args.num_pits,
             num_seeds=args.num_seeds,
             num_workers=bfs_workers,
+            num_writers=args.bfs_writers,
         )
 
-        logger.info("=" * 60)
+        logger.info(HR)
         logger.info("PHASE 1: Building game graph (BFS)")
-        logger.info("=" * 60)
+        logger.info(HR)
         total_positions = bfs_solver.build_game_graph()
 
+        if args.defer_indexes:
+            logger.info("Building minimax indexes...")
+            storage.create_minimax_indexes()
+
+        # Fresh statistics so minimax's seed-level queries get sensible plans
+        logger.info("Analyzing positions table...")
+        storage.analyze()
+
         # Optional: Cluster table before minimax for better performance
         if args.cluster_before_minimax:
-            logger.info("=" * 60)
+            logger.info(HR)
             logger.info("CLUSTERING: Reorganizing table for minimax performance")
-            logger.info("=" * 60)
+            logger.info(HR)
             logger.info("Running CLUSTER command on positions table...")
             logger.info("This physically reorders rows by seeds_in_pits for better cache locality")
 
@@ -75,6 +120,9 @@ def solve_command(args):
                 password=args.pg_password,
             )
             cursor = conn.cursor()
+            # Give the sort and the index rebuilds room to run in memory and in parallel
+            cursor.execute("SET maintenance_work_mem = '4GB';")
+            cursor.execute(f"SET max_parallel_maintenance_workers = {max(minimax_workers - 1, 0)};")
             cursor.execute("CLUSTER positions USING idx_seeds_in_pits;")
             conn.commit()
             cursor.close()
@@ -83,10 +131,10 @@ def solve_command(args):
             logger.info("Clustering complete! Minimax queries will be faster.")
 
         # Phase 2: Parallel Minimax with batching
-        logger.info("=" * 60)
+        logger.info(HR)
         logger.info("PHASE 2: Computing minimax values")
-        logger.info("=" * 60)
-        logger.info(f"Using parallel minimax solver with position batching")
+        logger.info(HR)
+        logger.info("Using parallel minimax solver with position batching")
 
         minimax_solver = ParallelMinimaxSolver(
             storage=storage,
@@ -98,16 +146,16 @@ def solve_command(args):
         starting_value = minimax_solver.solve()
 
         # Results
-        logger.info("=" * 60)
+        logger.info(HR)
         logger.info("SOLUTION COMPLETE")
-        logger.info("=" * 60)
+        logger.info(HR)
         logger.info(f"Total positions: {total_positions:,}")
-        logger.info(f"Starting position value: {starting_value}")
+        logger.info("Starting position value: %s", starting_value)
 
         if starting_value > 0:
-            logger.info(f"Result: Player 1 wins by {starting_value}")
+            logger.info("Result: Player 1 wins by %s", starting_value)
         elif starting_value < 0:
-            logger.info(f"Result: Player 2 wins by {-starting_value}")
+            logger.info("Result: Player 2 wins by %s", -starting_value)
         else:
             logger.info("Result: Perfect play leads to a tie")
 
@@ -117,11 +165,13 @@ def solve_command(args):
 
 def query_command(args):
     """Query a solved PostgreSQL database."""
+    from ..storage import PostgreSQLBackend
+
     setup_logging(args.log_level)
     logger = logging.getLogger(__name__)
 
     # Initialize PostgreSQL storage
-    logger.info(f"Backend: PostgreSQL ({args.pg_host}:{args.pg_port}/{args.pg_database})")
+    logger.info("Backend: PostgreSQL (%s:%s/%s)", args.pg_host, args.pg_port, args.pg_database)
     storage = PostgreSQLBackend(
         host=args.pg_host,
         port=args.pg_port,
@@ -131,24 +181,22 @@ def query_command(args):
     )
 
     try:
-        total = storage.count_positions()
-        max_depth = storage.get_max_depth()
-
-        logger.info(f"Database: {args.db_path}")
-        logger.info(f"Total positions: {total:,}")
-        logger.info(f"Maximum depth: {max_depth}")
-
-        # Get starting position
         from ..core import create_starting_state, zobrist_hash, init_zobrist_table
 
         init_zobrist_table(args.num_pits)
         start_state = create_starting_state(args.num_pits, args.num_seeds)
         start_hash = zobrist_hash(start_state)
-        start_pos = storage.get(start_hash)
+
+        # Totals and the starting position in one round-trip
+        total, max_depth, start_pos = storage.summary(start_hash)
+
+        logger.info("Database: %s", args.pg_database)
+        logger.info(f"Total positions: {total:,}")
+        logger.info("Maximum depth: %s", max_depth)
 
         if start_pos:
-            logger.info(f"Starting position value: {start_pos.minimax_value}")
-            logger.info(f"Best opening move: {start_pos.best_move}")
+            logger.info("Starting position value: %s", start_pos.minimax_value)
+            logger.info("Best opening move: %s", start_pos.best_move)
         else:
             logger.warning("Starting position not found in database")
 
@@ -158,20 +206,25 @@ def query_command(args):
 
 def minimax_command(args):
     """Run minimax on existing PostgreSQL positions."""
+    from ..storage import PostgreSQLBackend
+    from ..solver import ParallelMinimaxSolver
+
     setup_logging(args.log_level)
     logger = logging.getLogger(__name__)
 
-    logger.info(f"Running minimax for Kalah({args.num_pits},{args.num_seeds})")
-    logger.info(f"Workers: {args.workers}")
+    logger.info("Running minimax for Kalah(%s,%s)", args.num_pits, args.num_seeds)
+    logger.info("Workers: %s", args.workers)
 
     # Initialize PostgreSQL storage
-    logger.info(f"Backend: PostgreSQL ({args.pg_host}:{args.pg_port}/{args.pg_database})")
+    logger.info("Backend: PostgreSQL (%s:%s/%s)", args.pg_host, args.pg_port, args.pg_database)
     storage = PostgreSQLBackend(
         host=args.pg_host,
         port=args.pg_port,
         database=args.pg_database,
         user=args.pg_user,
         password=args.pg_password,
+        work_mem=args.pg_work_mem,
+        synchronous_commit=args.pg_synchronous_commit,
     )
 
     try:
@@ -180,10 +233,10 @@ def minimax_command(args):
         logger.info(f"Total positions in database: {total_positions:,}")
 
         # Phase 2: Parallel Minimax with batching
-        logger.info("=" * 60)
+        logger.info(HR)
         logger.info("PHASE 2: Computing minimax values")
-        logger.info("=" * 60)
-        logger.info(f"Using parallel minimax solver with position batching")
+        logger.info(HR)
+        logger.info("Using parallel minimax solver with position batching")
 
         minimax_solver = ParallelMinimaxSolver(
             storage=storage,
@@ -195,15 +248,15 @@ def minimax_command(args):
         starting_value = minimax_solver.solve()
 
         # Results
-        logger.info("=" * 60)
+        logger.info(HR)
         logger.info("MINIMAX COMPLETE")
-        logger.info("=" * 60)
-        logger.info(f"Starting position value: {starting_value}")
+        logger.info(HR)
+        logger.info("Starting position value: %s", starting_value)
 
         if starting_value > 0:
-            logger.info(f"Result: Player 1 wins by {starting_value}")
+            logger.info("Result: Player 1 wins by %s", starting_value)
         elif starting_value < 0:
-            logger.info(f"Result: Player 2 wins by {-starting_value}")
+            logger.info("Result: Player 2 wins by %s", -starting_value)
         else:
             logger.info("Result: Perfect play leads to a tie")
 
@@ -246,18 +299,39 @@ def main():
     solve_parser.add_argument(
         "--pg-password", default="", help="PostgreSQL password"
     )
+    solve_parser.add_argument(
+        "--pg-work-mem", default="256MB", help="PostgreSQL work_mem for each session"
+    )
+    solve_parser.add_argument(
+        "--pg-synchronous-commit",
+        action="store_true",
+        help="Keep synchronous_commit on (slower writes, survives a server crash)",
+    )
     solve_parser.add_argument(
         "--workers", type=int, default=1, help="Number of parallel workers (1=sequential)"
     )
     solve_parser.add_argument(
         "--bfs-workers", type=int, default=None, help="Number of workers for BFS phase (defaults to --workers)"
     )
+    solve_parser.add_argument(
+        "--bfs-writers",
+        type=int,
+        default=1,
+        help="BFS writer threads, each with its own PostgreSQL connection",
+    )
     solve_parser.add_argument(
         "--minimax-workers", type=int, default=None, help="Number of workers for minimax phase (defaults to --workers)"
     )
     solve_parser.add_argument(
-        "--cluster-before-minimax", action="store_true",
-        help="Run CLUSTER command to reorganize table before minimax (improves performance 20-40%)"
+        "--defer-indexes",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Drop idx_seeds_in_pits during BFS and build it afterwards (default: on)",
+    )
+    solve_parser.add_argument(
+        "--cluster-before-minimax",
+        action="store_true",
+        help="Run CLUSTER command to reorganize table before minimax (improves performance 20-40%%)",
     )
     solve_parser.set_defaults(func=solve_command)
 
@@ -302,8 +376,14 @@ def main():
         "--pg-password", default="", help="PostgreSQL password"
     )
     minimax_parser.add_argument(
-        "--workers", type=int, default=1, help="Number of parallel workers"
+        "--pg-work-mem", default="256MB", help="PostgreSQL work_mem for each session"
+    )
+    minimax_parser.add_argument(
+        "--pg-synchronous-commit",
+        action="store_true",
+        help="Keep synchronous_commit on (slower writes, survives a server crash)",
     )
+    minimax_parser.add_argument("--workers", type=int, default=1, help="Number of parallel workers")
     minimax_parser.set_defaults(func=minimax_command)
 
     args = parser.parse_args()
@@ -1,11 +1,13 @@
 """Core game state representation and rules."""
 
-from .game_state import GameState, pack_state, unpack_state
-from .hash import zobrist_hash, init_zobrist_table
+from .game_state import GameState, pack_state, unpack_state, pack_boards, unpack_boards
+from .hash import zobrist_hash, zobrist_hash_batch, init_zobrist_table
 from .rules import (
     create_starting_state,
     generate_legal_moves,
     apply_move,
+    apply_move_unchecked,
+    apply_moves_batch,
     is_terminal,
     evaluate_terminal,
     get_opposite_pit,
@@ -15,11 +17,16 @@ __all__ = [
     "GameState",
     "pack_state",
     "unpack_state",
+    "pack_boards",
+    "unpack_boards",
     "zobrist_hash",
+    "zobrist_hash_batch",
     "init_zobrist_table",
     "create_starting_state",
     "generate_legal_moves",
     "apply_move",
+    "apply_move_unchecked",
+    "apply_moves_batch",
     "is_terminal",
     "evaluate_terminal",
     "get_opposite_pit",
@@ -14,8 +14,14 @@ We use bit-packing to minimize memory footprint:
 from typing import List, Tuple
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass(frozen=True)
+
+BITS_PER_POSITION = 5  # Supports 0-31 seeds per position
+SEED_MASK = (1 << BITS_PER_POSITION) - 1
+
+
+@dataclass(frozen=True, slots=True)
 class GameState:
     """
     Immutable game state representation.
@@ -47,7 +53,7 @@ class GameState:
             )
         if self.player not in (0, 1):
             raise ValueError(f"Invalid player {self.player}, must be 0 or 1")
-        if any(seeds < 0 for seeds in self.board):
+        if min(self.board) < 0:
             raise ValueError("Negative seed count not allowed")
 
     @property
@@ -108,6 +114,20 @@ Player {self.player + 1}'s turn
         return board_str
 
 
+def _new_state(num_pits: int, board: Tuple[int, ...], player: int) -> GameState:
+    """
+    Build a GameState without running __post_init__ validation.
+
+    Only for states derived from an already valid state by the rules
+    (sowing can't change the board size or make a count negative).
+    """
+    state = object.__new__(GameState)
+    object.__setattr__(state, "num_pits", num_pits)
+    object.__setattr__(state, "board", board)
+    object.__setattr__(state, "player", player)
+    return state
+
+
 def pack_state(state: GameState) -> bytes:
     """
     Pack game state into compact byte representation.
@@ -115,6 +135,9 @@ def pack_state(state: GameState) -> bytes:
     Uses 5 bits per position (supports 0-31 seeds), plus 1 bit for player.
     For Kalah(6,4): 14 positions × 5 bits + 1 bit = 71 bits ≈ 9 bytes
 
+    Position i occupies bits 5*i .. 5*i+4 (little-endian), the player bit
+    follows the last position.
+
     Args:
         state: GameState to pack
 
@@ -122,34 +145,21 @@ def pack_state(state: GameState) -> bytes:
         Packed bytes representation
     """
     num_positions = len(state.board)
-    bits_per_position = 5
-    total_bits = num_positions * bits_per_position + 1  # +1 for player bit
-
-    # Calculate byte array size
-    num_bytes = (total_bits + 7) // 8  # Ceiling division
-    packed = bytearray(num_bytes)
+    total_bits = num_positions * BITS_PER_POSITION + 1  # +1 for player bit
 
-    # Pack each position (5 bits each)
-    bit_offset = 0
+    # Fold every position into one integer, then emit it in one call
+    acc = 0
+    shift = 0
     for seeds in state.board:
-        if seeds > 31:
+        if seeds > SEED_MASK:
             raise ValueError(f"Cannot pack {seeds} seeds (max 31 with 5 bits)")
-
-        # Write 5 bits for this position
-        for i in range(bits_per_position):
-            if seeds & (1 << i):
-                byte_idx = bit_offset // 8
-                bit_in_byte = bit_offset % 8
-                packed[byte_idx] |= 1 << bit_in_byte
-            bit_offset += 1
+        acc |= seeds << shift
+        shift += BITS_PER_POSITION
 
     # Pack player bit
-    if state.player == 1:
-        byte_idx = bit_offset // 8
-        bit_in_byte = bit_offset % 8
-        packed[byte_idx] |= 1 << bit_in_byte
+    acc |= state.player << shift
 
-    return bytes(packed)
+    return acc.to_bytes((total_bits + 7) // 8, "little")
 
 
 def unpack_state(packed: bytes, num_pits: int) -> GameState:
@@ -164,31 +174,54 @@ def unpack_state(packed: bytes, num_pits: int) -> GameState:
         Reconstructed GameState
     """
     num_positions = 2 * num_pits + 2
-    bits_per_position = 5
+    acc = int.from_bytes(packed, "little")
+
+    board = tuple(
+        (acc >> shift) & SEED_MASK
+        for shift in range(0, num_positions * BITS_PER_POSITION, BITS_PER_POSITION)
+    )
+    player = (acc >> (num_positions * BITS_PER_POSITION)) & 1
+
+    return GameState(num_pits=num_pits, board=board, player=player)
 
-    board = []
-    bit_offset = 0
 
-    # Unpack each position (5 bits each)
-    for _ in range(num_positions):
-        seeds = 0
-        for i in range(bits_per_position):
-            byte_idx = bit_offset // 8
-            bit_in_byte = bit_offset % 8
+def pack_boards(boards: np.ndarray, players: np.ndarray) -> np.ndarray:
+    """
+    Vectorized pack_state() for a batch of states.
 
-            if byte_idx < len(packed):
-                if packed[byte_idx] & (1 << bit_in_byte):
-                    seeds |= 1 << i
+    Args:
+        boards: (N, num_positions) integer array of seed counts
+        players: (N,) integer array of players to move
 
-            bit_offset += 1
+    Returns:
+        (N, packed_bytes) uint8 array; row i is pack_state() of state i
+    """
+    if boards.size and boards.max() > SEED_MASK:
+        raise ValueError(f"Cannot pack {boards.max()} seeds (max 31 with 5 bits)")
 
-        board.append(seeds)
+    # Bit j of the packed integer is bit j % 8 of byte j // 8 (little-endian)
+    shifts = np.arange(BITS_PER_POSITION)
+    bits = ((boards[:, :, None] >> shifts) & 1).reshape(len(boards), -1)
+    bits = np.concatenate([bits, (players & 1)[:, None]], axis=1).astype(np.uint8)
+    return np.packbits(bits, axis=1, bitorder="little")
+
+
+def unpack_boards(packed: np.ndarray, num_pits: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized unpack_state() for a batch of packed states.
 
-    # Unpack player bit
-    byte_idx = bit_offset // 8
-    bit_in_byte = bit_offset % 8
-    player = 0
-    if byte_idx < len(packed) and (packed[byte_idx] & (1 << bit_in_byte)):
-        player = 1
+    Args:
+        packed: (N, packed_bytes) uint8 array of pack_state() outputs
+        num_pits: Number of pits per player
+
+    Returns:
+        (boards, players): (N, num_positions) and (N,) intp arrays
+    """
+    num_positions = 2 * num_pits + 2
+    bits = np.unpackbits(packed, axis=1, bitorder="little").astype(np.intp)
 
-    return GameState(num_pits=num_pits, board=tuple(board), player=player)
+    position_bits = bits[:, : num_positions * BITS_PER_POSITION]
+    position_bits = position_bits.reshape(len(packed), num_positions, BITS_PER_POSITION)
+    boards = (position_bits << np.arange(BITS_PER_POSITION)).sum(axis=2)
+    players = bits[:, num_positions * BITS_PER_POSITION]
+    return boards, players
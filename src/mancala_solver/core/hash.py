@@ -6,38 +6,60 @@ for game positions. It's incremental and collision-resistant.
 """
 
 import random
-from typing import Dict, Tuple
-from .game_state import GameState
+from typing import List, Optional, Tuple
+
+import numpy as np
 
+from .game_state import GameState
 
-# Global Zobrist table (initialized once per configuration)
-_zobrist_table: Dict[Tuple[int, int, int], int] = {}
+# Global Zobrist table (initialized once per configuration), flattened so the
+# entry for (position, seeds) is _zobrist_table[position * max_seeds + seeds]
+_zobrist_table: List[int] = []
+# Same keys split per position (_zobrist_rows[position][seeds]) for zobrist_hash
+_zobrist_rows: List[List[int]] = []
 _zobrist_player: Tuple[int, int] = (0, 0)
+_zobrist_config: Tuple[int, int, int] = (0, 0, 0)  # (num_pits, max_seeds, seed) of the live table
+
+# NumPy views of the live table for zobrist_hash_batch (built on first use)
+_zobrist_array: Optional[np.ndarray] = None
+_zobrist_player_array: Optional[np.ndarray] = None
 
 
 def init_zobrist_table(num_pits: int, max_seeds: int = 32, seed: int = 42) -> None:
     """
     Initialize Zobrist hash table with random 64-bit numbers.
 
+    The table is fully determined by (num_pits, max_seeds, seed), so calling
+    this again with the same arguments is a no-op and hashes stay stable
+    across runs and processes.
+
     Args:
         num_pits: Number of pits per player
         max_seeds: Maximum seeds per position (for 5-bit packing: 32)
         seed: Random seed for reproducibility
     """
-    global _zobrist_table, _zobrist_player
+    global _zobrist_table, _zobrist_rows, _zobrist_player, _zobrist_config
+    global _zobrist_array, _zobrist_player_array
+
+    if _zobrist_table and _zobrist_config == (num_pits, max_seeds, seed):
+        return
 
     rng = random.Random(seed)
-    _zobrist_table = {}
 
     num_positions = 2 * num_pits + 2  # Total board positions
 
-    # Generate random 64-bit number for each (position, seed_count) pair
-    for position in range(num_positions):
-        for seeds in range(max_seeds):
-            _zobrist_table[(num_pits, position, seeds)] = rng.getrandbits(64)
+    # Generate random 64-bit number for each (position, seed_count) pair.
+    # Draw order (position-major) matches the flat index, keeping hashes
+    # identical to those already stored in databases.
+    _zobrist_table = [rng.getrandbits(64) for _ in range(num_positions * max_seeds)]
+    _zobrist_rows = [
+        _zobrist_table[i : i + max_seeds] for i in range(0, num_positions * max_seeds, max_seeds)
+    ]
 
     # Random numbers for player turn
     _zobrist_player = (rng.getrandbits(64), rng.getrandbits(64))
+    _zobrist_config = (num_pits, max_seeds, seed)
+    _zobrist_array = _zobrist_player_array = None
 
 
 def zobrist_hash(state: GameState) -> int:
@@ -54,16 +76,18 @@ def zobrist_hash(state: GameState) -> int:
     Returns:
         64-bit hash value
     """
-    if not _zobrist_table:
-        # Auto-initialize if not done already
+    if _zobrist_config[0] != state.num_pits:
+        # Auto-initialize if not done already (or built for another board size)
         init_zobrist_table(state.num_pits)
 
     h = 0
 
-    # XOR hash for each position's seed count
-    for position, seeds in enumerate(state.board):
-        if seeds > 0:  # Optimization: skip empty positions
-            h ^= _zobrist_table[(state.num_pits, position, seeds)]
+    # XOR hash for each position's seed count; per-position rows avoid the
+    # flat-index arithmetic, and empty positions (common late in the game)
+    # are skipped
+    for row, seeds in zip(_zobrist_rows, state.board):
+        if seeds:
+            h ^= row[seeds]
 
     # XOR hash for current player
     h ^= _zobrist_player[state.player]
@@ -71,6 +95,37 @@ def zobrist_hash(state: GameState) -> int:
     return h
 
 
+def zobrist_hash_batch(boards: np.ndarray, players: np.ndarray, num_pits: int) -> np.ndarray:
+    """
+    Compute Zobrist hashes for many states at once.
+
+    Equivalent to zobrist_hash() per row, but the gather and XOR-reduce run
+    in NumPy, amortizing interpreter overhead over the whole batch.
+
+    Args:
+        boards: (N, 2*num_pits+2) integer array of seed counts
+        players: (N,) integer array of players to move
+        num_pits: Number of pits per player
+
+    Returns:
+        (N,) uint64 array of hashes
+    """
+    global _zobrist_array, _zobrist_player_array
+
+    if _zobrist_config[0] != num_pits:
+        init_zobrist_table(num_pits)
+
+    if _zobrist_array is None:
+        num_positions = 2 * num_pits + 2
+        table = np.array(_zobrist_table, dtype=np.uint64).reshape(num_positions, -1)
+        table[:, 0] = 0  # Empty positions contribute nothing (as in zobrist_hash)
+        _zobrist_array = table
+        _zobrist_player_array = np.array(_zobrist_player, dtype=np.uint64)
+
+    gathered = _zobrist_array[np.arange(boards.shape[1]), boards]
+    return np.bitwise_xor.reduce(gathered, axis=1) ^ _zobrist_player_array[players]
+
+
 def hash_state(state: GameState) -> int:
     """Alias for zobrist_hash for convenience."""
     return zobrist_hash(state)
@@ -9,7 +9,10 @@ Implements standard Kalah rules:
 """
 
 from typing import List, Optional, Tuple
-from .game_state import GameState
+
+import numpy as np
+
+from .game_state import GameState, _new_state
 
 
 def create_starting_state(num_pits: int, num_seeds: int) -> GameState:
@@ -68,14 +71,10 @@ def generate_legal_moves(state: GameState) -> List[int]:
     Returns:
         List of legal pit indices to move from
     """
-    legal_moves = []
-    player_pits = state.get_player_pits(state.player)
-
-    for pit in player_pits:
-        if state.board[pit] > 0:
-            legal_moves.append(pit)
+    board = state.board
+    first_pit = 0 if state.player == 0 else state.num_pits + 1
 
-    return legal_moves
+    return [pit for pit in range(first_pit, first_pit + state.num_pits) if board[pit] > 0]
 
 
 def apply_move(state: GameState, move: int) -> GameState:
@@ -95,29 +94,58 @@ def apply_move(state: GameState, move: int) -> GameState:
 
     Returns:
         New GameState after move
+
+    Raises:
+        ValueError: If move is not a legal move for state
     """
-    # Validate move
-    if move not in generate_legal_moves(state):
+    num_pits = state.num_pits
+    first_pit = 0 if state.player == 0 else num_pits + 1
+
+    # Validate move: own pit with at least one seed
+    if not (first_pit <= move < first_pit + num_pits) or state.board[move] == 0:
         raise ValueError(f"Illegal move {move} for state")
 
+    return apply_move_unchecked(state, move)
+
+
+def apply_move_unchecked(state: GameState, move: int) -> GameState:
+    """
+    apply_move() without validation, for solver loops.
+
+    The move must come from generate_legal_moves(state); an illegal move
+    silently produces a meaningless state. The child is also built without
+    re-running GameState's invariant checks.
+
+    Args:
+        state: Current game state
+        move: Legal pit index to move from
+
+    Returns:
+        New GameState after move
+    """
+    num_pits = state.num_pits
+    current_player = state.player
+
+    # Player-relative layout (avoids building pit lists per move)
+    if current_player == 0:
+        first_pit, own_store, opponent_store = 0, num_pits, 2 * num_pits + 1
+    else:
+        first_pit, own_store, opponent_store = num_pits + 1, 2 * num_pits + 1, num_pits
+
     # Create mutable board copy
     board = list(state.board)
-    current_player = state.player
-    next_player = current_player  # May change if no extra turn
+    board_size = len(board)
 
     # Pick up seeds
     seeds_in_hand = board[move]
     board[move] = 0
-
-    # Determine sowing path (skip opponent's store)
-    opponent_store = state.get_player_store(1 - current_player)
     current_pos = move
 
-    # Sow seeds
+    # Sow seeds counter-clockwise, skipping opponent's store
     while seeds_in_hand > 0:
-        current_pos = (current_pos + 1) % len(board)
-
-        # Skip opponent's store
+        current_pos += 1
+        if current_pos == board_size:
+            current_pos = 0
         if current_pos == opponent_store:
             continue
 
@@ -125,31 +153,97 @@ def apply_move(state: GameState, move: int) -> GameState:
         seeds_in_hand -= 1
 
     # Check for extra turn (last seed in own store)
-    own_store = state.get_player_store(current_player)
     if current_pos == own_store:
         # Extra turn - player doesn't change
         next_player = current_player
     else:
-        # Check for capture
-        player_pits = state.get_player_pits(current_player)
-
-        if (
-            current_pos in player_pits  # Landed in own pit
-            and board[current_pos] == 1  # Pit was empty (now has 1 seed)
-        ):
-            opposite_pit = get_opposite_pit(current_pos, state.num_pits)
+        # Check for capture: last seed in own pit that was empty (now has 1 seed)
+        if first_pit <= current_pos < first_pit + num_pits and board[current_pos] == 1:
+            opposite_pit = 2 * num_pits - current_pos
 
             if board[opposite_pit] > 0:  # Opposite pit has seeds
                 # Capture!
-                captured = board[opposite_pit] + board[current_pos]
+                board[own_store] += board[opposite_pit] + 1
                 board[opposite_pit] = 0
                 board[current_pos] = 0
-                board[own_store] += captured
 
         # No extra turn - switch player
         next_player = 1 - current_player
 
-    return GameState(num_pits=state.num_pits, board=tuple(board), player=next_player)
+    return _new_state(num_pits, tuple(board), next_player)
+
+
+def apply_moves_batch(
+    boards: np.ndarray, players: np.ndarray, num_pits: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized apply_move() over every legal move of a batch of states.
+
+    Boards are rotated into the mover's frame (own pits 0..num_pits-1, own
+    store num_pits, opponent's store last), so sowing from relative pit m
+    is the same arithmetic for both players: the 2*num_pits+1 positions
+    before the opponent's store form a ring, and s seeds give every ring
+    position s // ring laps plus one more for the first s % ring positions
+    after m.
+
+    Args:
+        boards: (N, 2*num_pits+2) integer array of seed counts
+        players: (N,) integer array of players to move
+        num_pits: Number of pits per player
+
+    Returns:
+        (child_boards, child_players) for all legal moves of all states,
+        grouped by relative move rather than by parent
+    """
+    n = num_pits
+    ring = 2 * n + 1
+    rotate = n + 1  # P2's first pit moves to index 0
+
+    p2 = players == 1
+    rel = boards.astype(np.intp, copy=True)
+    rel[p2] = np.roll(boards[p2], -rotate, axis=1)
+
+    child_boards = []
+    child_players = []
+    for m in range(n):
+        movers = np.flatnonzero(rel[:, m])
+        if not len(movers):
+            continue
+
+        b = rel[movers]
+        seeds = b[:, m].copy()
+        b[:, m] = 0
+
+        # Seeds landing on each ring position: distance k from m (k = ring
+        # for m itself, which is only reached after a full lap)
+        k = (np.arange(ring) - m) % ring
+        k[k == 0] = ring
+        laps = seeds[:, None] - k
+        b[:, :ring] += np.where(laps >= 0, laps // ring + 1, 0)
+
+        last = (m + seeds) % ring
+        extra_turn = last == n
+
+        # Capture: last seed in an own pit that was empty, opposite has seeds
+        rows = np.arange(len(movers))
+        opposite = np.where(last < n, 2 * n - last, last)
+        capture = (last < n) & (b[rows, last] == 1) & (b[rows, opposite] > 0)
+        cap_rows, cap_last, cap_opp = rows[capture], last[capture], opposite[capture]
+        b[cap_rows, n] += b[cap_rows, cap_opp] + 1
+        b[cap_rows, cap_opp] = 0
+        b[cap_rows, cap_last] = 0
+
+        # Back to absolute positions (the frame is the parent's player)
+        parent_p2 = p2[movers]
+        b[parent_p2] = np.roll(b[parent_p2], rotate, axis=1)
+
+        mover_players = players[movers]
+        child_boards.append(b)
+        child_players.append(np.where(extra_turn, mover_players, 1 - mover_players))
+
+    if not child_boards:
+        return np.empty((0, 2 * n + 2), dtype=np.intp), np.empty(0, dtype=np.intp)
+    return np.concatenate(child_boards), np.concatenate(child_players)
 
 
 def is_terminal(state: GameState) -> bool:
@@ -164,13 +258,11 @@ def is_terminal(state: GameState) -> bool:
     Returns:
         True if game is over
     """
-    p1_pits = state.get_player_pits(0)
-    p2_pits = state.get_player_pits(1)
-
-    p1_empty = all(state.board[pit] == 0 for pit in p1_pits)
-    p2_empty = all(state.board[pit] == 0 for pit in p2_pits)
+    board = state.board
+    num_pits = state.num_pits
 
-    return p1_empty or p2_empty
+    # Slices instead of per-pit index lists: P1 pits, then P2 pits
+    return not any(board[:num_pits]) or not any(board[num_pits + 1 : 2 * num_pits + 1])
 
 
 def evaluate_terminal(state: GameState) -> int:
@@ -1,9 +1,28 @@
 """Optimized game solving algorithms for PostgreSQL."""
 
-from .parallel_minimax import ParallelMinimaxSolver
-from .chunked_bfs import ChunkedBFSSolver
+import importlib
+
+# Solvers are imported on first attribute access (PEP 562) so importing the
+# package doesn't pull in psycopg2, numpy and multiprocessing up front.
+_LAZY_IMPORTS = {
+    "ParallelMinimaxSolver": ".parallel_minimax",
+    "ChunkedBFSSolver": ".chunked_bfs",
+}
 
 __all__ = [
     "ParallelMinimaxSolver",
     "ChunkedBFSSolver",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ isn't hit again
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
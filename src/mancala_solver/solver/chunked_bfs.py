@@ -7,46 +7,151 @@ progress tracking for large-scale solves.
 PostgreSQL Optimizations:
 - ON CONFLICT DO NOTHING for zero-RAM deduplication
 - Async write queue to hide database I/O latency
-- Efficient LIMIT/OFFSET batch queries
+- Keyset-paginated parent fetches on (depth, state_hash)
 - MVCC allows concurrent inserts without lock contention
 """
 
 import logging
 import threading
+import time
+from functools import partial
+from multiprocessing import Pool
 from queue import Queue, Empty
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 from tqdm import tqdm
 
 from ..core import (
-    GameState,
     create_starting_state,
-    generate_legal_moves,
-    apply_move,
+    apply_moves_batch,
     zobrist_hash,
+    zobrist_hash_batch,
     pack_state,
+    pack_boards,
+    unpack_boards,
+    init_zobrist_table,
 )
-from ..storage import PostgreSQLBackend, Position
+from ..storage import StorageBackend, Position
 from ..utils import MemoryMonitor
 
 logger = logging.getLogger(__name__)
 
+# Slices per worker for each fetched chunk. Slices are handed to workers as
+# they free up, so many small slices keep a slow slice (uneven branching)
+# from leaving the other workers idle at the end of a chunk.
+SLICES_PER_WORKER = 16
+
+# Smallest slice worth a round trip to a worker process
+MIN_SLICE_PARENTS = 256
+
+# Largest slice: bounds the arrays alive at once per slice and
+# gets the first children to the writer early, also when running in-process
+MAX_SLICE_PARENTS = 4096
+
+# Parent chunks fetched ahead of the one being expanded
+PREFETCH_CHUNKS = 2
+
+# Rows the AsyncWriter buffers before put() blocks, in write batches
+WRITER_BUFFER_BATCHES = 32
+
+
+def _worker_init(num_pits: int) -> None:
+    """Initialize BFS worker process (Zobrist table for child hashing)."""
+    init_zobrist_table(num_pits)
+
+
+def _record_dtype(num_pits: int) -> np.dtype:
+    """Structured dtype for child records shipped back from pool workers."""
+    packed_bytes = ((2 * num_pits + 2) * 5 + 1 + 7) // 8  # matches pack_state()
+    return np.dtype(
+        [
+            ("state_hash", "<u8"),
+            ("state", f"V{packed_bytes}"),  # raw bytes: 'S' would strip trailing NULs
+            ("depth", "<i4"),
+            ("seeds_in_pits", "<i2"),
+        ]
+    )
+
+
+def _expand_parents_records(
+    parent_states: List[bytes], num_pits: int, child_depth: int
+) -> np.ndarray:
+    """
+    Generate all children of a slice of parent positions.
+
+    Runs in the main process or in a pool worker; storage is never touched
+    here. The slice is unpacked, sown, hashed and repacked as whole NumPy
+    arrays - no GameState is built per parent or per child.
+
+    Args:
+        parent_states: Packed parent states
+        num_pits: Number of pits per player
+        child_depth: Depth assigned to the generated children
+
+    Returns:
+        Structured array of (state_hash, state, depth, seeds_in_pits) rows
+        (a single buffer to pickle), ordered by signed state_hash, with
+        duplicates within the slice dropped
+    """
+    dtype = _record_dtype(num_pits)
+    state_bytes = dtype["state"].itemsize
+
+    packed = np.frombuffer(b"".join(parent_states), dtype=np.uint8)
+    boards, players = unpack_boards(packed.reshape(len(parent_states), state_bytes), num_pits)
+    boards, players = apply_moves_batch(boards, players, num_pits)
+
+    records = np.empty(len(boards), dtype=dtype)
+    records["state_hash"] = zobrist_hash_batch(boards, players, num_pits)
+    records["state"] = pack_boards(boards, players).view(dtype["state"]).ravel()
+    records["depth"] = child_depth
+    # Seeds in pits = all seeds minus both stores
+    records["seeds_in_pits"] = (
+        boards.sum(axis=1) - boards[:, num_pits] - boards[:, 2 * num_pits + 1]
+    )
+
+    # Sort by the key as PostgreSQL stores it (signed BIGINT) so each insert
+    # batch walks the primary key B-tree in order instead of at random
+    records = records[np.argsort(records["state_hash"].view(np.int64), kind="stable")]
+
+    # Equal hashes are now adjacent; keep the first of each run
+    hashes = records["state_hash"]
+    first = np.ones(len(records), dtype=bool)
+    first[1:] = hashes[1:] != hashes[:-1]
+    return records[first]
+
 
 class AsyncWriter:
     """
     Background writer thread for async database inserts.
 
-    Workers can queue positions without blocking on DB I/O.
-    Writer thread continuously pulls from queue and inserts.
+    Workers can queue child records without blocking on DB I/O. Records
+    are double-buffered: put() appends to the front buffer, and once it
+    holds a write batch the writer thread swaps it with the (empty) back
+    buffer under the lock, then inserts the back buffer without holding it.
+    One lock round trip per swap instead of per put, and each swap is a
+    single large insert_records. Nothing is committed until
+    wait_until_empty(), so each BFS depth is written in a single
+    transaction.
     """
 
-    def __init__(self, storage: PostgreSQLBackend):
+    def __init__(self, storage: StorageBackend):
         self.storage = storage
-        self.queue: Queue = Queue(maxsize=1000)  # Bounded to prevent memory explosion
+        self.batch_size = storage.recommended_batch_size
+        # Bounded to prevent memory explosion
+        self.max_buffered = self.batch_size * WRITER_BUFFER_BATCHES
+        # Buffers hold record arrays; *_rows count the rows in them
+        self.front: List[np.ndarray] = []
+        self.back: List[np.ndarray] = []
+        self.front_rows = 0
+        self.cond = threading.Condition()
+        self.writing = False
+        self.flush_requested = False
+        self.stopping = False
+        self.aborted = False
         self.total_queued = 0
         self.total_written = 0
-        self.batches_since_flush = 0
-        self.flush_every_n_batches = 5  # Flush less frequently for better throughput
-        self.stop_flag = threading.Event()
+        self.total_inserted = 0  # Rows new to the table (ON CONFLICT skips excluded)
         self.thread: Optional[threading.Thread] = None
         self.error: Optional[Exception] = None
 
@@ -56,71 +161,159 @@ class AsyncWriter:
         self.thread.start()
 
     def _writer_loop(self):
-        """Background thread that continuously writes from queue to database."""
+        """Background thread that swaps out full buffers and writes them."""
         try:
-            while not self.stop_flag.is_set() or not self.queue.empty():
-                try:
-                    # Wait up to 0.1s for item (allows checking stop_flag)
-                    batch = self.queue.get(timeout=0.1)
-                    if batch is None:  # Sentinel value to stop
-                        self.storage.flush()  # Final flush
+            while True:
+                with self.cond:
+                    while (
+                        self.front_rows < self.batch_size
+                        and not (self.front and self.flush_requested)
+                        and not self.stopping
+                    ):
+                        self.cond.wait()
+                    if not self.front:  # Stopping and fully drained
                         break
-
-                    # Write batch to database
-                    self.storage.insert_batch(batch)
-                    self.batches_since_flush += 1
-
-                    # Flush less frequently (every N batches) for better throughput
-                    if self.batches_since_flush >= self.flush_every_n_batches:
-                        self.storage.flush()
-                        self.batches_since_flush = 0
-
-                    self.total_written += len(batch)
-                    self.queue.task_done()
-
-                except Empty:
-                    # Normal - queue is empty, keep waiting
-                    continue
-                except Exception as e:
-                    logger.error(f"AsyncWriter error: {e}")
-                    self.error = e
-                    break
+                    self.front, self.back = self.back, self.front
+                    self.front_rows = 0
+                    self.writing = True
+                    self.cond.notify_all()  # Room again for blocked producers
+
+                # Write batch to database (committed per depth, see
+                # wait_until_empty)
+                records = np.concatenate(self.back)
+                self.back.clear()
+                self.total_inserted += self.storage.insert_records(records)
+                self.total_written += len(records)
+
+                with self.cond:
+                    self.writing = False
+                    self.cond.notify_all()
+
+            if not self.aborted:
+                self.storage.flush()  # Final flush
         except Exception as e:
-            logger.error(f"AsyncWriter fatal error: {e}")
-            self.error = e
-
-    def put(self, positions: List[Position]) -> None:
-        """Queue positions for async writing."""
-        if self.error:
-            raise self.error
-
-        self.queue.put(positions)
-        self.total_queued += len(positions)
+            logger.error(f"AsyncWriter error: {e}")
+            with self.cond:
+                self.error = e
+                self.writing = False
+                self.cond.notify_all()
+
+    def put(self, records: np.ndarray) -> None:
+        """Queue child records for async writing."""
+        with self.cond:
+            while self.front_rows >= self.max_buffered and self.error is None:
+                self.cond.wait()
+            if self.error:
+                raise self.error
+
+            self.front.append(records)
+            self.front_rows += len(records)
+            self.total_queued += len(records)
+            if self.front_rows >= self.batch_size:
+                self.cond.notify_all()
 
     def wait_until_empty(self) -> None:
         """Block until all queued writes complete."""
-        self.queue.join()
-        # Flush any pending batches
-        self.storage.flush()
+        with self.cond:
+            self.flush_requested = True
+            self.cond.notify_all()
+            while (self.front or self.writing) and self.error is None:
+                self.cond.wait()
+            self.flush_requested = False
 
         if self.error:
             raise self.error
 
+        # Commit everything written since the last call (one transaction per depth)
+        self.storage.flush()
+
     def stop(self) -> None:
         """Stop the writer thread gracefully."""
-        self.stop_flag.set()
-        self.queue.put(None)  # Sentinel to wake up thread
+        with self.cond:
+            self.stopping = True
+            self.cond.notify_all()
+        if self.thread:
+            self.thread.join(timeout=10)
+
+    def abort(self) -> None:
+        """
+        Stop the writer thread without writing or committing what's queued.
+
+        A batch already being inserted finishes, but stays uncommitted; the
+        caller rolls the storage back.
+        """
+        with self.cond:
+            self.front.clear()
+            self.front_rows = 0
+            self.aborted = True
+            self.stopping = True
+            self.cond.notify_all()
         if self.thread:
             self.thread.join(timeout=10)
 
 
+class AsyncWriterPool:
+    """
+    Several AsyncWriters, each on its own storage connection.
+
+    Rows are partitioned by state_hash % num_writers, so the writers
+    insert disjoint key sets. Each writer keeps one open transaction per
+    depth; if two of them inserted the same key, the second would block on
+    the first's uncommitted row until the end of the depth (or deadlock).
+    Same interface as AsyncWriter.
+    """
+
+    def __init__(self, storages: List[StorageBackend]):
+        self.writers = [AsyncWriter(storage) for storage in storages]
+
+    @property
+    def total_queued(self) -> int:
+        return sum(w.total_queued for w in self.writers)
+
+    @property
+    def total_written(self) -> int:
+        return sum(w.total_written for w in self.writers)
+
+    @property
+    def total_inserted(self) -> int:
+        return sum(w.total_inserted for w in self.writers)
+
+    def start(self):
+        """Start every writer thread."""
+        for writer in self.writers:
+            writer.start()
+
+    def put(self, records: np.ndarray) -> None:
+        """Queue records, each row to the writer owning its hash partition."""
+        partition = records["state_hash"] % len(self.writers)
+        for i, writer in enumerate(self.writers):
+            part = records[partition == i]
+            if len(part):
+                writer.put(part)
+
+    def wait_until_empty(self) -> None:
+        """Block until every writer has written and committed its queue."""
+        for writer in self.writers:
+            writer.wait_until_empty()
+
+    def stop(self) -> None:
+        """Stop every writer thread."""
+        for writer in self.writers:
+            writer.stop()
+
+    def abort(self) -> None:
+        """Stop every writer thread, dropping what's queued."""
+        for writer in self.writers:
+            writer.abort()
+
+
 class ChunkedBFSSolver:
     """
     Memory-efficient BFS solver optimized for PostgreSQL.
 
     Strategy:
     - For each depth level:
-      - Fetch parents in chunks from storage (LIMIT/OFFSET)
+      - Fetch parents in chunks from storage (keyset pagination)
       - Generate all children for chunk
       - Queue for async write (non-blocking)
       - Continue immediately to next chunk
@@ -129,11 +322,12 @@ class ChunkedBFSSolver:
 
     def __init__(
         self,
-        storage: PostgreSQLBackend,
+        storage: StorageBackend,
         num_pits: int,
         num_seeds: int,
         num_workers: int = 1,
         chunk_size: int = 100_000,
+        num_writers: int = 1,
     ):
         """
         Initialize chunked BFS solver.
@@ -142,14 +336,18 @@ class ChunkedBFSSolver:
             storage: PostgreSQL storage backend
             num_pits: Number of pits per player
             num_seeds: Initial seeds per pit
-            num_workers: Number of parallel workers (not used yet, for future)
+            num_workers: Number of worker processes for child generation (1 = in-process)
             chunk_size: Number of positions to process per chunk
+            num_writers: Writer threads, each with its own database connection
         """
         self.storage = storage
         self.num_pits = num_pits
         self.num_seeds = num_seeds
         self.num_workers = num_workers
         self.chunk_size = chunk_size
+        self.num_writers = num_writers
+        self.pool: Optional[Pool] = None
+        self.count_from_db = False
 
         # Memory monitoring
         self.memory_monitor = MemoryMonitor(
@@ -157,10 +355,10 @@ class ChunkedBFSSolver:
         )
 
         logger.info(f"Chunked BFS solver initialized")
-        logger.info(f"Workers: {num_workers} (currently single-threaded)")
+        logger.info(f"Workers: {num_workers}")
         logger.info(f"Chunk size: {chunk_size:,} positions per chunk")
         logger.info(f"PostgreSQL deduplication: ON CONFLICT DO NOTHING (zero RAM overhead)")
-        logger.info(f"Async writes: enabled (background writer thread)")
+        logger.info(f"Async writes: enabled ({num_writers} background writer thread(s))")
         logger.info(f"Memory monitoring: enabled")
 
     def build_game_graph(self) -> int:
@@ -181,23 +379,48 @@ class ChunkedBFSSolver:
             depth=0,
             seeds_in_pits=start_state.seeds_in_pits,
         )
-        self.storage.insert(start_pos)
+        # An existing start position means the table already holds a graph:
+        # nothing new gets inserted, so depth sizes must come from COUNT(*)
+        self.count_from_db = not self.storage.insert(start_pos)
         self.storage.flush()
-        logger.info("Inserted starting position")
-
-        # Create ONE AsyncWriter for entire BFS (reuse across all depths)
-        async_writer = AsyncWriter(self.storage)
-        async_writer.start()
-        logger.info("Async writer started (will be reused for all depths)")
-
+        if self.count_from_db:
+            logger.warning("Starting position already stored; counting depths from the database")
+        else:
+            logger.info("Inserted starting position")
+
+        # Worker pool for child generation; all inserts go through the
+        # main process's AsyncWriter (or AsyncWriterPool)
+        if self.num_workers > 1:
+            # Pool forks its workers up front, before the writer thread
+            # exists, so they are not forked from a multi-threaded process
+            self.pool = Pool(
+                processes=self.num_workers,
+                initializer=_worker_init,
+                initargs=(self.num_pits,),
+            )
+            logger.info(f"Started {self.num_workers} BFS worker processes")
+
+        writer_storages: List[StorageBackend] = []
+        async_writer: Optional[Union[AsyncWriter, AsyncWriterPool]] = None
+        completed = False
         try:
+            # Create ONE AsyncWriter for entire BFS (reuse across all depths).
+            # Writers get their own connections: a COPY in progress can't
+            # share one with the parent fetches
+            for _ in range(self.num_writers):
+                writer_storages.append(self._open_writer_storage())
+            if self.num_writers > 1:
+                async_writer = AsyncWriterPool(writer_storages)
+            else:
+                async_writer = AsyncWriter(writer_storages[0])
+            async_writer.start()
+            logger.info("Async writer started (will be reused for all depths)")
+
             current_depth = 0
             total_positions = 1
+            positions_at_depth = 1  # Depth 0 is just the starting position
 
             while True:
-                # Count positions at current depth
-                positions_at_depth = self.storage.count_positions(depth=current_depth)
-
                 if positions_at_depth == 0:
                     logger.info(f"Depth {current_depth}: No positions - BFS complete")
                     break
@@ -216,20 +439,67 @@ class ChunkedBFSSolver:
                     f"Depth {current_depth}: Generated {new_positions_count:,} new positions (total: {total_positions:,})"
                 )
 
+                # The new positions are exactly the next depth's parents, so
+                # the count above doubles as the next depth's size
                 current_depth += 1
+                positions_at_depth = new_positions_count
 
-        finally:
             # Stop writer at end of ALL depths
             logger.info("Waiting for all async writes to complete...")
             async_writer.wait_until_empty()
-            async_writer.stop()
-            logger.info(f"All writes complete: {async_writer.total_written:,} positions written")
+            completed = True
+
+        finally:
+            try:
+                try:
+                    if completed:
+                        async_writer.stop()
+                        logger.info(
+                            f"All writes complete: {async_writer.total_written:,} positions written"
+                        )
+                    else:
+                        # Never commit a half-written depth: drop what's
+                        # queued and roll back what was already inserted
+                        if async_writer is not None:
+                            async_writer.abort()
+                        for writer_storage in writer_storages:
+                            writer_storage.rollback()
+                finally:
+                    for writer_storage in writer_storages:
+                        writer_storage.close()
+            finally:
+                if self.pool is not None:
+                    if completed:
+                        self.pool.close()
+                    else:
+                        self.pool.terminate()
+                    self.pool.join()
+                    self.pool = None
 
         logger.info(f"Chunked BFS complete! Total positions: {total_positions:,}")
         return total_positions
 
+    def _open_writer_storage(self) -> StorageBackend:
+        """Open another connection to the same database for a writer thread."""
+        from ..storage import PostgreSQLBackend
+
+        return PostgreSQLBackend(
+            host=self.storage.host,
+            port=self.storage.port,
+            database=self.storage.database,
+            user=self.storage.user,
+            password=self.storage.password,
+            unlogged=self.storage.unlogged,
+            work_mem=self.storage.work_mem,
+            synchronous_commit=self.storage.synchronous_commit,
+            page_size=self.storage.page_size,
+        )
+
     def _process_depth_chunked(
-        self, depth: int, total_at_depth: int, async_writer: AsyncWriter
+        self,
+        depth: int,
+        total_at_depth: int,
+        async_writer: Union[AsyncWriter, AsyncWriterPool],
     ) -> int:
         """
         Process all positions at a depth in chunks.
@@ -240,21 +510,22 @@ class ChunkedBFSSolver:
             async_writer: Shared AsyncWriter for all depths
 
         Returns:
-            Number of new positions generated
+            Number of new positions generated (all positions now at depth + 1)
         """
+        inserted_before = async_writer.total_inserted
         num_chunks = (total_at_depth + self.chunk_size - 1) // self.chunk_size
 
         # Calculate logging interval for intra-depth progress
         log_interval = max(1, min(100, num_chunks // 10))
 
         total_inserted = 0
-        offset = 0
 
         # Progress bar for this depth
         with tqdm(total=num_chunks, desc=f"Depth {depth}", unit="chunk") as pbar:
             chunk_num = 0
 
-            while True:
+            # The next chunks are fetched in the background while this one expands
+            for parent_states in self._prefetch_chunks(depth):
                 chunk_num += 1
 
                 # Memory monitoring - pause if critical
@@ -263,46 +534,21 @@ class ChunkedBFSSolver:
                         "Critical memory pressure detected, pausing 10s for GC"
                     )
                     self.memory_monitor.log_status()
-                    import time
                     time.sleep(10)
 
-                # Fetch chunk of parent positions
-                parents = self._fetch_chunk(depth, offset, self.chunk_size)
-
-                if not parents:
-                    break
-
-                # Generate all children for this chunk
-                chunk_new_positions = []
-                for parent_pos in parents:
-                    from ..core.game_state import unpack_state
-
-                    parent_state = unpack_state(parent_pos.state, self.num_pits)
-
-                    for move in generate_legal_moves(parent_state):
-                        child_state = apply_move(parent_state, move)
-                        child_hash = zobrist_hash(child_state)
-
-                        # PostgreSQL handles dedup via ON CONFLICT DO NOTHING
-                        child_pos = Position(
-                            state_hash=child_hash,
-                            state=pack_state(child_state),
-                            depth=depth + 1,
-                            seeds_in_pits=child_state.seeds_in_pits,
-                        )
-                        chunk_new_positions.append(child_pos)
-
-                # Queue for async writing (non-blocking!)
-                if chunk_new_positions:
-                    async_writer.put(chunk_new_positions)
-                    total_inserted += len(chunk_new_positions)
+                # Generate all children for this chunk; each slice is queued
+                # for async writing as soon as it's ready (non-blocking!)
+                chunk_new_count = self._expand_chunk(parent_states, depth + 1, async_writer)
+                total_inserted += chunk_new_count
 
                 # Update progress
-                pbar.set_postfix({
-                    "chunk": f"{chunk_num}/{num_chunks}",
-                    "new": len(chunk_new_positions),
-                    "total_new": total_inserted,
-                })
+                pbar.set_postfix(
+                    {
+                        "chunk": f"{chunk_num}/{num_chunks}",
+                        "new": chunk_new_count,
+                        "total_new": total_inserted,
+                    }
+                )
                 pbar.update(1)
 
                 # Periodic logging for TUI monitoring
@@ -313,25 +559,127 @@ class ChunkedBFSSolver:
                         f"{total_inserted:,} new positions generated so far"
                     )
 
-                offset += self.chunk_size
-
         # Wait for async writes to complete before counting (don't stop writer - reuse for next depth!)
         async_writer.wait_until_empty()
 
-        # Final count from database
-        final_count = self.storage.count_positions(depth=depth + 1)
-        return final_count
+        if self.count_from_db:
+            return self.storage.count_positions(depth=depth + 1)
+        # Every child is at depth + 1, so the rows the writers actually
+        # inserted are exactly the new positions - no COUNT(*) scan needed
+        return async_writer.total_inserted - inserted_before
+
+    def _expand_chunk(
+        self,
+        parent_states: List[bytes],
+        child_depth: int,
+        async_writer: Union[AsyncWriter, AsyncWriterPool],
+    ) -> int:
+        """
+        Generate children for a chunk, fanning slices out to the worker pool if any.
+
+        Each slice's children go straight to the writer as the slice
+        completes, so the chunk's children are never held in one list.
+        Records stay arrays all the way to the writer's COPY, no Position
+        is built per child.
+
+        Args:
+            parent_states: Packed parent states
+            child_depth: Depth assigned to the generated children
+            async_writer: Writer that receives the child positions
+
+        Returns:
+            Number of child positions queued (unique within each slice)
+        """
+        if self.pool is None:
+            slice_size = MAX_SLICE_PARENTS
+        else:
+            num_slices = self.num_workers * SLICES_PER_WORKER
+            slice_size = -(-len(parent_states) // num_slices)
+            slice_size = min(MAX_SLICE_PARENTS, max(MIN_SLICE_PARENTS, slice_size))
+        slices = [
+            parent_states[i : i + slice_size] for i in range(0, len(parent_states), slice_size)
+        ]
+
+        expand = partial(_expand_parents_records, num_pits=self.num_pits, child_depth=child_depth)
+        if self.pool is None:
+            results = map(expand, slices)
+        else:
+            # Unordered: the writer doesn't care which slice lands first
+            results = self.pool.imap_unordered(expand, slices, chunksize=1)
+
+        queued = 0
+        for records in results:
+            if len(records):
+                async_writer.put(records)
+                queued += len(records)
+        return queued
+
+    def _prefetch_chunks(self, depth: int) -> Iterator[List[bytes]]:
+        """
+        Yield the parent chunks of a depth, fetching ahead on a background thread.
+
+        While the caller expands one chunk, the thread is already waiting on
+        the database for the next PREFETCH_CHUNKS, so fetch latency overlaps
+        with child generation.
 
-    def _fetch_chunk(self, depth: int, offset: int, limit: int) -> List[Position]:
+        Args:
+            depth: Depth to fetch from
+
+        Yields:
+            Non-empty lists of packed parent states, in fetch order
         """
-        Fetch a chunk of positions at a given depth using efficient LIMIT/OFFSET.
+        chunks: Queue = Queue(maxsize=PREFETCH_CHUNKS)
+        stop = threading.Event()
+
+        def fetch_loop():
+            last_hash = None
+            try:
+                while not stop.is_set():
+                    rows = self._fetch_chunk(depth, self.chunk_size, last_hash)
+                    if rows:
+                        chunks.put([state for _, state in rows])
+                    if len(rows) < self.chunk_size:
+                        chunks.put([])
+                        return
+                    last_hash = rows[-1][0]
+            except Exception as e:
+                chunks.put(e)
+
+        thread = threading.Thread(target=fetch_loop, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = chunks.get()
+                if isinstance(item, Exception):
+                    raise item
+                if not item:
+                    return
+                yield item
+        finally:
+            # Unblock the fetcher if the caller stopped early
+            stop.set()
+            while thread.is_alive():
+                try:
+                    chunks.get_nowait()
+                except Empty:
+                    thread.join(timeout=0.1)
+
+    def _fetch_chunk(
+        self, depth: int, limit: int, last_hash: Optional[int]
+    ) -> List[Tuple[int, bytes]]:
+        """
+        Fetch a chunk of parent states at a given depth using keyset pagination.
+
+        Each chunk starts after the last hash of the previous one, so a deep
+        chunk costs the same as the first (LIMIT/OFFSET rescans every row
+        before the offset). Only hashes and packed states are fetched.
 
         Args:
             depth: Depth to fetch from
-            offset: Starting offset
             limit: Maximum positions to fetch
+            last_hash: Last state_hash of the previous chunk (None = first)
 
         Returns:
-            List of positions
+            List of (state_hash, packed state) pairs
         """
-        return self.storage.get_positions_at_depth_batch(depth, limit, offset)
+        return self.storage.get_states_at_depth_after(depth, limit, last_hash)
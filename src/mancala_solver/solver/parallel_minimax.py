@@ -7,104 +7,143 @@ are solved can be processed simultaneously across multiple cores.
 
 import logging
 import time
+from collections import OrderedDict
 from multiprocessing import Pool, cpu_count
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from tqdm import tqdm
 
 from ..core import (
     GameState,
+    create_starting_state,
     generate_legal_moves,
-    apply_move,
+    apply_move_unchecked,
     is_terminal,
     evaluate_terminal,
     zobrist_hash,
     init_zobrist_table,
 )
 from ..core.game_state import unpack_state
-from ..storage import StorageBackend, Position
+from ..storage import StorageBackend
 from ..utils import MemoryMonitor
 
 logger = logging.getLogger(__name__)
 
 
+# Tasks queued per worker for each pool call. Many small chunks let workers
+# that finish early pick up more work instead of idling behind one slow chunk.
+TASKS_PER_WORKER = 16
+
+# Solved child values kept per worker. Solved values never change, and the
+# solve pass re-reads exactly the children the solvability pass just fetched.
+CHILD_CACHE_SIZE = 1 << 18
+
 # Global storage for worker processes
 _worker_storage = None
 _worker_num_pits = None
+_worker_child_cache: "OrderedDict[int, int]" = OrderedDict()
 
 
-def _worker_init(backend_type: str, backend_params: dict, num_pits: int) -> None:
+def _worker_init(backend_params: dict, num_pits: int) -> None:
     """Initialize worker process with its own storage connection."""
     global _worker_storage, _worker_num_pits
-    from ..storage import SQLiteBackend, PostgreSQLBackend
+    from ..storage import PostgreSQLBackend
 
-    if backend_type == "sqlite":
-        _worker_storage = SQLiteBackend(backend_params["db_path"])
-    elif backend_type == "postgresql":
-        _worker_storage = PostgreSQLBackend(**backend_params)
-    else:
-        raise ValueError(f"Unknown backend type: {backend_type}")
+    _worker_storage = PostgreSQLBackend(**backend_params)
 
     _worker_num_pits = num_pits
     init_zobrist_table(num_pits)
 
 
-def _worker_check_solvable(pos: Position) -> Tuple[int, bool]:
+def _child_hashes(state: GameState) -> List[Tuple[int, int]]:
+    """(move, child_hash) for every legal move."""
+    return [
+        (move, zobrist_hash(apply_move_unchecked(state, move)))
+        for move in generate_legal_moves(state)
+    ]
+
+
+def _solved_values(state_hashes: List[int]) -> Dict[int, int]:
+    """
+    Minimax values of the given hashes that are already solved.
+
+    Cache misses are fetched with one get_many() round-trip; unsolved
+    positions are left out of the result (and out of the cache).
+    """
+    cache = _worker_child_cache
+    values = {}
+    missing = []
+    for state_hash in state_hashes:
+        value = cache.get(state_hash)
+        if value is None:
+            missing.append(state_hash)
+        else:
+            cache.move_to_end(state_hash)
+            values[state_hash] = value
+
+    if missing:
+        for state_hash, pos in _worker_storage.get_many(missing).items():
+            if pos.minimax_value is not None:
+                values[state_hash] = pos.minimax_value
+                cache[state_hash] = pos.minimax_value
+        while len(cache) > CHILD_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    return values
+
+
+def _worker_check_solvable(task: Tuple[int, bytes]) -> Tuple[int, bool]:
     """
     Worker: Check if a position is solvable (all children solved).
 
+    Args:
+        task: (state_hash, packed state)
+
     Returns:
         (state_hash, is_solvable)
     """
-    state = unpack_state(pos.state, _worker_num_pits)
+    state_hash, packed = task
+    state = unpack_state(packed, _worker_num_pits)
 
     # Terminal positions are always solvable
     if is_terminal(state):
-        return (pos.state_hash, True)
+        return (state_hash, True)
 
     # Check if all children are solved
-    for move in generate_legal_moves(state):
-        next_state = apply_move(state, move)
-        next_hash = zobrist_hash(next_state)
-        child_pos = _worker_storage.get(next_hash)
-
-        if child_pos is None or child_pos.minimax_value is None:
-            return (pos.state_hash, False)
+    child_hashes = [h for _, h in _child_hashes(state)]
+    values = _solved_values(child_hashes)
+    return (state_hash, all(h in values for h in child_hashes))
 
-    return (pos.state_hash, True)
 
-
-def _worker_solve_position(pos: Position) -> Tuple[int, int, Optional[int]]:
+def _worker_solve_position(task: Tuple[int, bytes]) -> Tuple[int, int, Optional[int]]:
     """
     Worker: Solve a single position's minimax value.
 
+    Args:
+        task: (state_hash, packed state)
+
     Returns:
         (state_hash, minimax_value, best_move)
     """
-    state = unpack_state(pos.state, _worker_num_pits)
+    state_hash, packed = task
+    state = unpack_state(packed, _worker_num_pits)
 
     # Terminal state
     if is_terminal(state):
         value = evaluate_terminal(state)
-        return (pos.state_hash, value, None)
+        return (state_hash, value, None)
 
     # Minimax search
-    legal_moves = generate_legal_moves(state)
+    children = _child_hashes(state)
+    values = _solved_values([h for _, h in children])
     is_maximizing = state.player == 0  # P1 maximizes
 
     best_value = float("-inf") if is_maximizing else float("inf")
     best_move = None
 
-    for move in legal_moves:
-        next_state = apply_move(state, move)
-        next_hash = zobrist_hash(next_state)
-
-        child_pos = _worker_storage.get(next_hash)
-        if child_pos is None or child_pos.minimax_value is None:
-            raise RuntimeError(
-                f"Child not solved during parallel solve: hash={next_hash}"
-            )
-
-        child_value = child_pos.minimax_value
+    for move, next_hash in children:
+        child_value = values.get(next_hash)
+        if child_value is None:
+            raise RuntimeError(f"Child not solved during parallel solve: hash={next_hash}")
 
         if is_maximizing:
             if child_value > best_value:
@@ -115,7 +154,7 @@ def _worker_solve_position(pos: Position) -> Tuple[int, int, Optional[int]]:
                 best_value = child_value
                 best_move = move
 
-    return (pos.state_hash, best_value, best_move)
+    return (state_hash, best_value, best_move)
 
 
 class ParallelMinimaxSolver:
@@ -162,26 +201,24 @@ class ParallelMinimaxSolver:
         else:
             self.memory_monitor = None
 
-        # Detect backend type and extract parameters for workers
-        from ..storage import SQLiteBackend, PostgreSQLBackend
-
-        if isinstance(storage, SQLiteBackend):
-            self.backend_type = "sqlite"
-            self.backend_params = {"db_path": storage.db_path}
-        elif isinstance(storage, PostgreSQLBackend):
-            self.backend_type = "postgresql"
-            self.backend_params = {
-                "host": storage.host,
-                "port": storage.port,
-                "database": storage.database,
-                "user": storage.user,
-                "password": storage.password
-            }
-        else:
+        # Extract connection parameters so each worker opens its own connection
+        from ..storage import PostgreSQLBackend
+
+        if not isinstance(storage, PostgreSQLBackend):
             raise ValueError(f"Unsupported storage backend: {type(storage)}")
 
+        self.backend_params = {
+            "host": storage.host,
+            "port": storage.port,
+            "database": storage.database,
+            "user": storage.user,
+            "password": storage.password,
+            "work_mem": storage.work_mem,
+            "synchronous_commit": storage.synchronous_commit,
+            "page_size": storage.page_size,
+        }
+
         logger.info(f"Using {self.num_workers} worker processes for minimax")
-        logger.info(f"Backend: {self.backend_type}")
         logger.info(f"Batch size: {self.batch_size:,} positions per batch (memory-efficient streaming)")
 
     def solve(self) -> int:
@@ -194,10 +231,13 @@ class ParallelMinimaxSolver:
         logger.info("Starting parallel retrograde minimax analysis")
         logger.info(f"Max seeds in pits: {self.max_seeds_in_pits}")
 
+        # Every seed-level query filters on seeds_in_pits; no-op if already built
+        self.storage.create_minimax_indexes()
+
         with Pool(
             processes=self.num_workers,
             initializer=_worker_init,
-            initargs=(self.backend_type, self.backend_params, self.num_pits),
+            initargs=(self.backend_params, self.num_pits),
         ) as pool:
             with tqdm(
                 total=self.max_seeds_in_pits + 1, desc="Minimax", unit=" seed_layer"
@@ -238,11 +278,11 @@ class ParallelMinimaxSolver:
 
                             # Adaptive chunksize based on memory pressure
                             if self.memory_monitor.should_throttle():
-                                chunk_multiplier = 2
+                                chunk_multiplier = TASKS_PER_WORKER // 2
                             else:
-                                chunk_multiplier = 4
+                                chunk_multiplier = TASKS_PER_WORKER
                         else:
-                            chunk_multiplier = 4
+                            chunk_multiplier = TASKS_PER_WORKER
 
                         # Process unsolved positions in batches to avoid OOM
                         # ======================================================
@@ -261,30 +301,45 @@ class ParallelMinimaxSolver:
                             if not batch:
                                 break  # No more unsolved in this iteration
 
+                            # Workers only need (hash, packed state); plain tuples
+                            # pickle far smaller than Position dataclasses
+                            tasks = [(pos.state_hash, pos.state) for pos in batch]
+
                             # Parallel check: which positions in this batch are solvable?
-                            solvability_results = pool.map(
-                                _worker_check_solvable,
-                                batch,
-                                chunksize=max(1, len(batch) // (self.num_workers * chunk_multiplier))
-                            )
+                            # (unordered: results are keyed by hash, so chunks
+                            # are handed out as workers free up)
+                            solvable_hashes = {
+                                state_hash
+                                for state_hash, solvable in pool.imap_unordered(
+                                    _worker_check_solvable,
+                                    tasks,
+                                    chunksize=max(
+                                        1, len(tasks) // (self.num_workers * chunk_multiplier)
+                                    ),
+                                )
+                                if solvable
+                            }
 
                             # Filter to solvable positions
-                            solvable_positions = [
-                                batch[i] for i, (_, solvable) in enumerate(solvability_results) if solvable
-                            ]
+                            solvable_tasks = [task for task in tasks if task[0] in solvable_hashes]
 
                             # Parallel solve: compute minimax values for solvable positions
-                            if solvable_positions:
-                                solve_results = pool.map(
-                                    _worker_solve_position,
-                                    solvable_positions,
-                                    chunksize=max(1, len(solvable_positions) // (self.num_workers * chunk_multiplier))
+                            if solvable_tasks:
+                                solve_results = list(
+                                    pool.imap_unordered(
+                                        _worker_solve_position,
+                                        solvable_tasks,
+                                        chunksize=max(
+                                            1,
+                                            len(solvable_tasks)
+                                            // (self.num_workers * chunk_multiplier),
+                                        ),
+                                    )
                                 )
 
-                                # Update storage with results
-                                for state_hash, value, best_move in solve_results:
-                                    self.storage.update_solution(state_hash, value, best_move)
-                                    batch_solved_count += 1
+                                # Update storage with results in bulk
+                                self.storage.update_solutions_batch(solve_results)
+                                batch_solved_count += len(solve_results)
 
                                 self.storage.flush()
 
@@ -308,8 +363,6 @@ class ParallelMinimaxSolver:
                     pbar.update(1)
 
         # Get starting position value
-        from ..core import create_starting_state
-
         start_state = create_starting_state(self.num_pits, self.num_seeds)
         start_hash = zobrist_hash(start_state)
         start_pos = self.storage.get(start_hash)
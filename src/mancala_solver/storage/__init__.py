@@ -1,6 +1,25 @@
 """PostgreSQL storage backend for position databases."""
 
+import importlib
+
 from .base import StorageBackend, Position
-from .postgresql import PostgreSQLBackend
+
+# The PostgreSQL backend (psycopg2) is imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "PostgreSQLBackend": ".postgresql",
+}
 
 __all__ = ["StorageBackend", "Position", "PostgreSQLBackend"]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ isn't hit again
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
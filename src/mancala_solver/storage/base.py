@@ -1,9 +1,11 @@
 """Abstract base class for storage backends."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Iterator
+from typing import Dict, List, Optional, Iterator, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class Position:
@@ -22,6 +24,11 @@ class Position:
 class StorageBackend(ABC):
     """Abstract interface for position storage."""
 
+    @property
+    def recommended_batch_size(self) -> int:
+        """Rows per bulk write this backend handles best."""
+        return 10_000
+
     @abstractmethod
     def insert(self, position: Position) -> bool:
         """
@@ -48,6 +55,23 @@ class StorageBackend(ABC):
         """
         pass
 
+    def insert_records(self, records: np.ndarray) -> int:
+        """
+        Bulk insert from a structured array (deduplicated like insert_batch).
+
+        Callers that already hold columnar data (state_hash, state, depth,
+        seeds_in_pits fields) skip building a Position per row; this default
+        builds them, backends override it to encode the columns directly.
+
+        Args:
+            records: Structured array with the four Position insert fields
+
+        Returns:
+            Number of new positions inserted
+        """
+        fields = ["state_hash", "state", "depth", "seeds_in_pits"]
+        return self.insert_batch([Position(*row) for row in records[fields].tolist()])
+
     @abstractmethod
     def exists(self, state_hash: int) -> bool:
         """
@@ -74,6 +98,25 @@ class StorageBackend(ABC):
         """
         pass
 
+    def get_many(self, state_hashes: List[int]) -> Dict[int, Position]:
+        """
+        Retrieve several positions by hash.
+
+        Backends can override this to fetch all of them in one round-trip.
+
+        Args:
+            state_hashes: Hashes of states
+
+        Returns:
+            Mapping of hash to Position for the hashes that exist
+        """
+        positions = {}
+        for state_hash in state_hashes:
+            pos = self.get(state_hash)
+            if pos is not None:
+                positions[state_hash] = pos
+        return positions
+
     @abstractmethod
     def get_positions_at_depth(self, depth: int) -> Iterator[Position]:
         """
@@ -104,6 +147,33 @@ class StorageBackend(ABC):
         """
         pass
 
+    def get_states_at_depth_after(
+        self, depth: int, limit: int, after_hash: Optional[int] = None
+    ) -> List[Tuple[int, bytes]]:
+        """
+        Get the next batch of (state_hash, packed state) at a given depth.
+
+        Keyset pagination: pass the last hash of the previous batch as
+        after_hash instead of an offset, so each batch costs the same no
+        matter how far into the depth it is. Rows come in the backend's
+        key order; this default orders by unsigned hash and rescans the
+        depth, backends with an index on (depth, state_hash) override it.
+
+        Args:
+            depth: BFS depth
+            limit: Maximum number of states to fetch
+            after_hash: Last state_hash of the previous batch (None = start)
+
+        Returns:
+            (state_hash, state) pairs; fewer than limit means the depth is done
+        """
+        rows = sorted(
+            (p.state_hash, p.state)
+            for p in self.get_positions_at_depth(depth)
+            if after_hash is None or p.state_hash > after_hash
+        )
+        return rows[:limit]
+
     @abstractmethod
     def get_positions_by_seeds_in_pits(self, seeds_in_pits: int) -> Iterator[Position]:
         """
@@ -162,6 +232,16 @@ class StorageBackend(ABC):
         """
         pass
 
+    def update_solutions_batch(self, solutions: List[Tuple[int, int, Optional[int]]]) -> None:
+        """
+        Update many positions with solved minimax values.
+
+        Args:
+            solutions: (state_hash, minimax_value, best_move) tuples
+        """
+        for state_hash, minimax_value, best_move in solutions:
+            self.update_solution(state_hash, minimax_value, best_move)
+
     @abstractmethod
     def count_positions(self, depth: Optional[int] = None) -> int:
         """
@@ -185,6 +265,36 @@ class StorageBackend(ABC):
         """
         pass
 
+    def summary(self, state_hash: int) -> Tuple[int, int, Optional[Position]]:
+        """
+        Get database totals together with one position.
+
+        Backends can override this to answer in a single round-trip.
+
+        Args:
+            state_hash: Hash of the position to fetch (usually the start)
+
+        Returns:
+            (total positions, maximum depth or -1, position or None)
+        """
+        return self.count_positions(), self.get_max_depth(), self.get(state_hash)
+
+    def drop_minimax_indexes(self) -> None:
+        """Drop indexes only minimax needs, ahead of a bulk load (no-op by default)."""
+        pass
+
+    def create_minimax_indexes(self) -> None:
+        """Build the indexes minimax's seed-level queries rely on (no-op by default)."""
+        pass
+
+    def analyze(self) -> None:
+        """Refresh query planner statistics after a bulk load (no-op by default)."""
+        pass
+
+    def rollback(self) -> None:
+        """Discard uncommitted writes (no-op by default)."""
+        pass
+
     @abstractmethod
     def flush(self) -> None:
         """Ensure all pending writes are persisted."""
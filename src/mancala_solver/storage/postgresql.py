@@ -1,10 +1,55 @@
 """PostgreSQL storage backend for cloud scalability."""
 
+import io
+import logging
+import struct
+
+import numpy as np
 import psycopg2
 import psycopg2.extras
-from typing import List, Optional, Iterator
+from typing import Dict, List, Optional, Iterator, Tuple
 from .base import StorageBackend, Position
 
+logger = logging.getLogger(__name__)
+
+# Default rows per multi-row INSERT/UPDATE statement sent by execute_values.
+# PostgreSQL gains little past a few thousand rows per statement and can
+# slow down beyond ~10K.
+PAGE_SIZE = 10_000
+
+# Indexes only the minimax phase reads; BFS can load without them
+MINIMAX_INDEXES = {
+    "idx_seeds_in_pits": "CREATE INDEX IF NOT EXISTS idx_seeds_in_pits ON positions(seeds_in_pits)",
+}
+
+# Binary COPY framing: signature + flags + header extension length, and
+# the -1 field count that ends the data
+COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+COPY_TRAILER = struct.pack(">h", -1)
+
+# Per row: field count, then (length, value) for state_hash and the
+# state's length; after the state bytes, (length, value) for depth and
+# seeds_in_pits
+_COPY_ROW_HEAD = struct.Struct(">hiqi")
+_COPY_ROW_TAIL = struct.Struct(">iiih")
+
+
+def _copy_row_dtype(state_bytes: int) -> np.dtype:
+    """The same binary COPY row as a packed big-endian structured dtype."""
+    return np.dtype(
+        [
+            ("fields", ">i2"),
+            ("hash_len", ">i4"),
+            ("state_hash", ">i8"),
+            ("state_len", ">i4"),
+            ("state", f"V{state_bytes}"),
+            ("depth_len", ">i4"),
+            ("depth", ">i4"),
+            ("seeds_len", ">i4"),
+            ("seeds_in_pits", ">i2"),
+        ]
+    )
+
 
 def _to_signed_int64(n: int) -> int:
     """Convert unsigned 64-bit to signed 64-bit for PostgreSQL BIGINT."""
@@ -39,6 +84,9 @@ class PostgreSQLBackend(StorageBackend):
         user: str = "postgres",
         password: str = "",
         unlogged: bool = True,
+        work_mem: str = "256MB",
+        synchronous_commit: bool = False,
+        page_size: int = PAGE_SIZE,
     ):
         """
         Initialize PostgreSQL backend.
@@ -50,6 +98,10 @@ class PostgreSQLBackend(StorageBackend):
             user: Database user
             password: Database password
             unlogged: Use UNLOGGED tables (3-5× faster writes, no crash recovery)
+            work_mem: Per-session work_mem for sorts and hash joins
+            synchronous_commit: Wait for WAL flush on commit (off is faster,
+                and safe here since an interrupted run can be rebuilt)
+            page_size: Rows per multi-row INSERT/UPDATE statement
         """
         # Store connection parameters for worker processes
         self.host = host
@@ -58,6 +110,17 @@ class PostgreSQLBackend(StorageBackend):
         self.user = user
         self.password = password
         self.unlogged = unlogged
+        self.work_mem = work_mem
+        self.synchronous_commit = synchronous_commit
+        self.page_size = page_size
+        self._staging_created = False  # positions_staging exists in this session
+
+        if page_size > PAGE_SIZE:
+            logger.warning(
+                "page_size=%s: PostgreSQL bulk statements tend to slow down past %s rows",
+                page_size,
+                PAGE_SIZE,
+            )
 
         self.conn = psycopg2.connect(
             host=host,
@@ -70,6 +133,11 @@ class PostgreSQLBackend(StorageBackend):
         self._create_schema()
         self._optimize()
 
+    @property
+    def recommended_batch_size(self) -> int:
+        """Rows per bulk statement (execute_values page size)."""
+        return self.page_size
+
     def _create_schema(self) -> None:
         """Create database schema."""
         unlogged_keyword = "UNLOGGED" if self.unlogged else ""
@@ -85,8 +153,11 @@ class PostgreSQLBackend(StorageBackend):
                     best_move SMALLINT                        -- 2 bytes (was 4 bytes) - max pit index is small
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_depth ON positions(depth);
-                CREATE INDEX IF NOT EXISTS idx_seeds_in_pits ON positions(seeds_in_pits);
+                -- (depth, state_hash) serves depth scans in hash order, per-depth
+                -- counts and MAX(depth) from one index; supersedes idx_depth
+                CREATE INDEX IF NOT EXISTS idx_depth_hash ON positions(depth, state_hash);
+                DROP INDEX IF EXISTS idx_depth;
+                -- idx_seeds_in_pits is built by create_minimax_indexes()
             """
             )
             self.conn.commit()
@@ -95,12 +166,40 @@ class PostgreSQLBackend(StorageBackend):
         """Apply PostgreSQL performance optimizations."""
         with self.conn.cursor() as cursor:
             # Increase work memory for faster sorts/joins
-            cursor.execute("SET work_mem = '256MB';")
-            # Disable synchronous commit for faster writes (data in memory, not disk)
-            # Safe for our use case since we can rebuild if interrupted
-            cursor.execute("SET synchronous_commit = OFF;")
+            cursor.execute("SELECT set_config('work_mem', %s, false)", (self.work_mem,))
+            # Synchronous commit is off by default for faster writes; safe for
+            # our use case since we can rebuild if interrupted
+            cursor.execute(
+                "SELECT set_config('synchronous_commit', %s, false)",
+                ("on" if self.synchronous_commit else "off",),
+            )
             self.conn.commit()
 
+    def drop_minimax_indexes(self) -> None:
+        """Drop indexes BFS doesn't need, so bulk inserts skip their upkeep."""
+        with self.conn.cursor() as cursor:
+            for name in MINIMAX_INDEXES:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        self.conn.commit()
+
+    def create_minimax_indexes(self, maintenance_work_mem: str = "1GB") -> None:
+        """(Re)build the minimax indexes in one sorted pass after a bulk load."""
+        self.conn.commit()
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT set_config('maintenance_work_mem', %s, true)", (maintenance_work_mem,)
+            )
+            for sql in MINIMAX_INDEXES.values():
+                cursor.execute(sql)
+        self.conn.commit()
+
+    def analyze(self) -> None:
+        """Refresh planner statistics after a bulk load."""
+        self.conn.commit()
+        with self.conn.cursor() as cursor:
+            cursor.execute("ANALYZE positions")
+        self.conn.commit()
+
     def insert(self, position: Position) -> bool:
         """Insert single position."""
         try:
@@ -114,27 +213,79 @@ class PostgreSQLBackend(StorageBackend):
                 )
                 return True
         except psycopg2.IntegrityError:  # Duplicate primary key
-            self.conn.rollback()
+            self.rollback()
             return False
 
     def insert_batch(self, positions: List[Position]) -> int:
-        """Bulk insert with deduplication."""
+        """
+        Bulk insert with deduplication.
+
+        Rows are streamed with binary COPY into a session-local staging
+        table and merged with one INSERT ... SELECT ... ON CONFLICT DO
+        NOTHING, so the server neither parses a multi-row VALUES list nor
+        converts text fields. Returns the number of rows actually inserted.
+        """
         if not positions:
             return 0
 
+        buf = io.BytesIO()
+        buf.write(COPY_HEADER)
+        for p in positions:
+            buf.write(_COPY_ROW_HEAD.pack(4, 8, _to_signed_int64(p.state_hash), len(p.state)))
+            buf.write(p.state)
+            buf.write(_COPY_ROW_TAIL.pack(4, p.depth, 2, p.seeds_in_pits))
+        buf.write(COPY_TRAILER)
+        buf.seek(0)
+        return self._copy_merge(buf)
+
+    def insert_records(self, records: np.ndarray) -> int:
+        """Bulk insert from a structured array; COPY rows are encoded in NumPy."""
+        if not len(records):
+            return 0
+
+        state_bytes = records.dtype["state"].itemsize
+        rows = np.empty(len(records), dtype=_copy_row_dtype(state_bytes))
+        rows["fields"] = 4
+        rows["hash_len"] = 8
+        rows["state_hash"] = records["state_hash"].view(np.int64)
+        rows["state_len"] = state_bytes
+        rows["state"] = records["state"]
+        rows["depth_len"] = 4
+        rows["depth"] = records["depth"]
+        rows["seeds_len"] = 2
+        rows["seeds_in_pits"] = records["seeds_in_pits"]
+        return self._copy_merge(io.BytesIO(COPY_HEADER + rows.tobytes() + COPY_TRAILER))
+
+    def _copy_merge(self, buf: io.BytesIO) -> int:
+        """COPY a binary stream into the staging table and merge it into positions."""
         with self.conn.cursor() as cursor:
-            # Use execute_values for fast bulk insert
-            psycopg2.extras.execute_values(
-                cursor,
+            if not self._staging_created:
+                cursor.execute(
+                    """
+                    CREATE TEMP TABLE IF NOT EXISTS positions_staging (
+                        state_hash BIGINT,
+                        state BYTEA,
+                        depth INTEGER,
+                        seeds_in_pits SMALLINT
+                    )
+                """
+                )
+                self._staging_created = True
+            cursor.copy_expert(
+                "COPY positions_staging (state_hash, state, depth, seeds_in_pits) "
+                "FROM STDIN WITH (FORMAT binary)",
+                buf,
+            )
+            cursor.execute(
                 """
                 INSERT INTO positions (state_hash, state, depth, seeds_in_pits)
-                VALUES %s
+                SELECT state_hash, state, depth, seeds_in_pits FROM positions_staging
                 ON CONFLICT (state_hash) DO NOTHING
-            """,
-                [(_to_signed_int64(p.state_hash), p.state, p.depth, p.seeds_in_pits) for p in positions],
-                page_size=1000,
+            """
             )
-            return cursor.rowcount if cursor.rowcount > 0 else len(positions)
+            inserted = cursor.rowcount
+            cursor.execute("TRUNCATE positions_staging")
+            return inserted
 
     def exists(self, state_hash: int) -> bool:
         """Check if position exists."""
@@ -162,6 +313,29 @@ class PostgreSQLBackend(StorageBackend):
                 )
             return None
 
+    def get_many(self, state_hashes: List[int]) -> Dict[int, Position]:
+        """Retrieve several positions by hash in one round-trip."""
+        if not state_hashes:
+            return {}
+
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT * FROM positions WHERE state_hash = ANY(%s)",
+                ([_to_signed_int64(h) for h in state_hashes],),
+            )
+            positions = {}
+            for row in cursor:
+                state_hash = _from_signed_int64(row[0])
+                positions[state_hash] = Position(
+                    state_hash=state_hash,
+                    state=bytes(row[1]),
+                    depth=row[2],
+                    seeds_in_pits=row[3],
+                    minimax_value=row[4],
+                    best_move=row[5],
+                )
+            return positions
+
     def get_positions_at_depth(self, depth: int) -> Iterator[Position]:
         """Iterate positions at depth."""
         with self.conn.cursor(name='depth_cursor') as cursor:
@@ -185,6 +359,7 @@ class PostgreSQLBackend(StorageBackend):
                 """
                 SELECT * FROM positions
                 WHERE depth = %s
+                ORDER BY state_hash
                 LIMIT %s OFFSET %s
                 """,
                 (depth, limit, offset),
@@ -203,6 +378,34 @@ class PostgreSQLBackend(StorageBackend):
                 )
             return positions
 
+    def get_states_at_depth_after(
+        self, depth: int, limit: int, after_hash: Optional[int] = None
+    ) -> List[Tuple[int, bytes]]:
+        """Get next batch of (hash, state) at depth by keyset on idx_depth_hash."""
+        # Keyset on the stored (signed) key, so batches follow index order
+        with self.conn.cursor() as cursor:
+            if after_hash is None:
+                cursor.execute(
+                    """
+                    SELECT state_hash, state FROM positions
+                    WHERE depth = %s
+                    ORDER BY state_hash
+                    LIMIT %s
+                    """,
+                    (depth, limit),
+                )
+            else:
+                cursor.execute(
+                    """
+                    SELECT state_hash, state FROM positions
+                    WHERE depth = %s AND state_hash > %s
+                    ORDER BY state_hash
+                    LIMIT %s
+                    """,
+                    (depth, _to_signed_int64(after_hash), limit),
+                )
+            return [(_from_signed_int64(row[0]), bytes(row[1])) for row in cursor]
+
     def get_positions_by_seeds_in_pits(self, seeds_in_pits: int) -> Iterator[Position]:
         """Iterate positions by seeds in pits."""
         with self.conn.cursor(name='seeds_cursor') as cursor:
@@ -272,6 +475,27 @@ class PostgreSQLBackend(StorageBackend):
                 (minimax_value, best_move, _to_signed_int64(state_hash)),
             )
 
+    def update_solutions_batch(self, solutions: List[Tuple[int, int, Optional[int]]]) -> None:
+        """Bulk update solutions with one UPDATE ... FROM (VALUES ...) per page."""
+        if not solutions:
+            return
+
+        with self.conn.cursor() as cursor:
+            # Casts in the template: an all-NULL best_move column would
+            # otherwise be typed as text
+            psycopg2.extras.execute_values(
+                cursor,
+                """
+                UPDATE positions AS p
+                SET minimax_value = v.minimax_value, best_move = v.best_move
+                FROM (VALUES %s) AS v(state_hash, minimax_value, best_move)
+                WHERE p.state_hash = v.state_hash
+            """,
+                [(_to_signed_int64(h), value, move) for h, value, move in solutions],
+                template="(%s::bigint, %s::smallint, %s::smallint)",
+                page_size=self.page_size,
+            )
+
     def count_positions(self, depth: Optional[int] = None) -> int:
         """Count positions."""
         with self.conn.cursor() as cursor:
@@ -290,10 +514,46 @@ class PostgreSQLBackend(StorageBackend):
             result = cursor.fetchone()[0]
             return result if result is not None else -1
 
+    def summary(self, state_hash: int) -> Tuple[int, int, Optional[Position]]:
+        """Get total count, max depth and one position in a single query."""
+        with self.conn.cursor() as cursor:
+            # LEFT JOIN from a one-row relation so the totals come back even
+            # when the position is missing
+            cursor.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM positions),
+                    (SELECT MAX(depth) FROM positions),
+                    p.*
+                FROM (SELECT 1) AS one
+                LEFT JOIN positions p ON p.state_hash = %s
+                """,
+                (_to_signed_int64(state_hash),),
+            )
+            row = cursor.fetchone()
+            total, max_depth = row[0], row[1]
+            position = None
+            if row[2] is not None:
+                position = Position(
+                    state_hash=_from_signed_int64(row[2]),
+                    state=bytes(row[3]),
+                    depth=row[4],
+                    seeds_in_pits=row[5],
+                    minimax_value=row[6],
+                    best_move=row[7],
+                )
+            return total, max_depth if max_depth is not None else -1, position
+
     def flush(self) -> None:
         """Commit pending transactions."""
         self.conn.commit()
 
+    def rollback(self) -> None:
+        """Discard uncommitted writes."""
+        self.conn.rollback()
+        # The rolled-back transaction may have created it; recheck on next use
+        self._staging_created = False
+
     def close(self) -> None:
         """Close database connection."""
         self.conn.commit()
@@ -0,0 +1,161 @@
+"""Tests for the chunked BFS writer and child expansion (no database needed)."""
+
+import threading
+
+import numpy as np
+import pytest
+from src.mancala_solver.core import (
+    apply_move,
+    create_starting_state,
+    generate_legal_moves,
+    init_zobrist_table,
+    pack_state,
+    zobrist_hash,
+)
+from src.mancala_solver.solver.chunked_bfs import (
+    AsyncWriter,
+    AsyncWriterPool,
+    _expand_parents_records,
+    _record_dtype,
+)
+
+
+class FakeStorage:
+    """Records every insert_records call; optionally fails on the first one."""
+
+    recommended_batch_size = 4
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batches = []
+        self.flushes = 0
+        self.lock = threading.Lock()
+
+    def insert_records(self, records):
+        if self.fail:
+            raise RuntimeError("insert failed")
+        with self.lock:
+            self.batches.append(records["state_hash"].tolist())
+        return len(records)
+
+    def flush(self):
+        self.flushes += 1
+
+    @property
+    def written(self):
+        return [h for batch in self.batches for h in batch]
+
+
+class ParkingCondition(threading.Condition):
+    """Condition that signals once a thread has parked in wait()."""
+
+    def __init__(self):
+        super().__init__()
+        self.parked = threading.Event()
+
+    def wait(self, timeout=None):
+        self.parked.set()
+        return super().wait(timeout)
+
+
+def make_records(hashes):
+    records = np.zeros(len(hashes), dtype=_record_dtype(num_pits=2))
+    records["state_hash"] = hashes
+    return records
+
+
+def test_async_writer_swaps_full_batches_and_flushes_rest():
+    """Nothing is written below a batch; wait_until_empty drains and commits."""
+    storage = FakeStorage()
+    writer = AsyncWriter(storage)
+    writer.cond = ParkingCondition()
+    writer.put(make_records([1, 2, 3]))  # Queued before the thread runs
+    writer.start()
+    try:
+        # Parked means the writer saw the 3 rows and chose not to write them
+        assert writer.cond.parked.wait(timeout=5)
+        with writer.cond:
+            assert writer.front_rows == 3
+            assert not writer.writing
+        assert storage.batches == []
+
+        writer.put(make_records([4, 5]))
+        writer.put(make_records([6]))
+        writer.wait_until_empty()
+
+        assert sorted(storage.written) == [1, 2, 3, 4, 5, 6]
+        assert storage.batches[0][:5] == [1, 2, 3, 4, 5]
+        assert storage.flushes == 1
+        assert writer.total_written == writer.total_inserted == 6
+    finally:
+        writer.stop()
+    assert not writer.thread.is_alive()
+
+
+def test_async_writer_error_reaches_producer():
+    """A failed insert is re-raised by wait_until_empty and later puts."""
+    writer = AsyncWriter(FakeStorage(fail=True))
+    writer.start()
+    try:
+        writer.put(make_records([1, 2, 3, 4]))
+        with pytest.raises(RuntimeError, match="insert failed"):
+            writer.wait_until_empty()
+        with pytest.raises(RuntimeError, match="insert failed"):
+            writer.put(make_records([5]))
+    finally:
+        writer.stop()
+
+
+def test_async_writer_abort_drops_queue_without_commit():
+    """abort() neither writes the queued rows nor commits."""
+    storage = FakeStorage()
+    writer = AsyncWriter(storage)
+    writer.start()
+    writer.put(make_records([1, 2]))
+    writer.abort()
+
+    assert not writer.thread.is_alive()
+    assert storage.batches == []
+    assert storage.flushes == 0
+
+
+def test_async_writer_pool_partitions_by_hash():
+    """Each writer only ever sees hashes of its own hash % N partition."""
+    storages = [FakeStorage() for _ in range(3)]
+    pool = AsyncWriterPool(storages)
+    pool.start()
+    try:
+        hashes = [2**64 - 1, 2**63, 0, 1, 2, 3, 4, 5, 17, 2**40 + 7]
+        pool.put(make_records(hashes))
+        pool.wait_until_empty()
+        assert [s.flushes for s in storages] == [1, 1, 1]
+    finally:
+        pool.stop()
+
+    for i, storage in enumerate(storages):
+        assert all(h % 3 == i for h in storage.written)
+    assert sorted(h for s in storages for h in s.written) == sorted(hashes)
+    assert pool.total_written == len(hashes)
+
+
+def test_expand_parents_records_sorted_unique_children():
+    """Records hold each distinct child once, ordered by signed hash."""
+    init_zobrist_table(3)
+    frontier = [create_starting_state(num_pits=3, num_seeds=3)]
+    for _ in range(3):
+        frontier = [apply_move(p, m) for p in frontier for m in generate_legal_moves(p)]
+
+    records = _expand_parents_records([pack_state(s) for s in frontier], 3, child_depth=4)
+
+    children = {
+        zobrist_hash(child): child
+        for parent in frontier
+        for child in (apply_move(parent, m) for m in generate_legal_moves(parent))
+    }
+    signed = records["state_hash"].view(np.int64)
+    assert (np.diff(signed) > 0).all()
+    assert sorted(records["state_hash"].tolist()) == sorted(children)
+    for row in records.tolist():
+        child = children[row[0]]
+        assert row[1] == pack_state(child)
+        assert row[2:] == (4, child.seeds_in_pits)
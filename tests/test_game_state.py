@@ -1,7 +1,14 @@
 """Tests for game state representation."""
 
+import numpy as np
 import pytest
-from src.mancala_solver.core import GameState, pack_state, unpack_state
+from src.mancala_solver.core import (
+    GameState,
+    pack_state,
+    unpack_state,
+    pack_boards,
+    unpack_boards,
+)
 
 
 def test_create_game_state():
@@ -80,3 +87,32 @@ def test_state_validation():
     # Negative seeds
     with pytest.raises(ValueError):
         GameState(num_pits=4, board=tuple([0, -1, 0, 0, 0, 0, 0, 0, 0, 0]), player=0)
+
+
+def test_pack_boards_matches_pack_state():
+    """Batch packing is byte-identical to pack_state() and round-trips."""
+    boards = np.array(
+        [
+            [0] * 4 + [0] + [0] * 4 + [0],
+            [0] * 4 + [24] + [0] * 4 + [24],
+            [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+            [31, 0, 17, 2, 11, 3, 0, 9, 1, 30],
+        ]
+    )
+    players = np.array([0, 1, 0, 1])
+
+    packed = pack_boards(boards, players)
+    for row, board, player in zip(packed, boards, players):
+        state = GameState(num_pits=4, board=tuple(board.tolist()), player=int(player))
+        assert bytes(row) == pack_state(state)
+
+    unpacked_boards, unpacked_players = unpack_boards(packed, num_pits=4)
+    assert (unpacked_boards == boards).all()
+    assert (unpacked_players == players).all()
+
+
+def test_pack_boards_rejects_overflow():
+    """More than 31 seeds in one position cannot be packed."""
+    boards = np.array([[32] + [0] * 9])
+    with pytest.raises(ValueError):
+        pack_boards(boards, np.array([0]))
@@ -0,0 +1,35 @@
+"""Tests for Zobrist hashing."""
+
+import random
+
+import numpy as np
+from src.mancala_solver.core import GameState, zobrist_hash, zobrist_hash_batch
+
+
+def test_zobrist_hash_batch_matches_scalar():
+    """Batch hashing agrees with zobrist_hash, including empty positions."""
+    rng = random.Random(0)
+    states = [
+        GameState(
+            num_pits=4,
+            board=tuple(rng.choice([0, 0, 1, 3, 7, 31]) for _ in range(10)),
+            player=rng.randint(0, 1),
+        )
+        for _ in range(200)
+    ]
+
+    boards = np.array([s.board for s in states], dtype=np.intp)
+    players = np.array([s.player for s in states], dtype=np.intp)
+
+    hashes = zobrist_hash_batch(boards, players, num_pits=4)
+
+    assert hashes.dtype == np.uint64
+    assert hashes.tolist() == [zobrist_hash(s) for s in states]
+
+
+def test_zobrist_hash_batch_empty():
+    """An empty batch returns an empty array."""
+    boards = np.empty((0, 10), dtype=np.intp)
+    players = np.empty(0, dtype=np.intp)
+
+    assert zobrist_hash_batch(boards, players, num_pits=4).shape == (0,)
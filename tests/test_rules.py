@@ -1,10 +1,13 @@
 """Tests for game rules."""
 
+import numpy as np
 import pytest
 from src.mancala_solver.core import (
     create_starting_state,
     generate_legal_moves,
     apply_move,
+    apply_move_unchecked,
+    apply_moves_batch,
     is_terminal,
     evaluate_terminal,
     get_opposite_pit,
@@ -153,3 +156,46 @@ def test_evaluate_terminal_with_remaining_seeds():
     # P2: 5 (store) + 2+3+4+5 (remaining) = 19
     # Value: 10 - 19 = -9
     assert value == -9
+
+
+def test_apply_move_unchecked_matches_apply_move():
+    """Unchecked moves give the same states as validated ones."""
+    frontier = [create_starting_state(num_pits=3, num_seeds=3)]
+
+    for _ in range(6):
+        next_frontier = []
+        for parent in frontier:
+            for move in generate_legal_moves(parent):
+                child = apply_move_unchecked(parent, move)
+                assert child == apply_move(parent, move)
+                assert hash(child) == hash(apply_move(parent, move))
+                next_frontier.append(child)
+        frontier = next_frontier
+
+
+def test_apply_move_rejects_illegal_move():
+    """apply_move still validates: empty pit and opponent's pit."""
+    state = GameState(num_pits=3, board=(0, 2, 2, 0, 2, 2, 2, 0), player=0)
+    with pytest.raises(ValueError):
+        apply_move(state, 0)
+    with pytest.raises(ValueError):
+        apply_move(state, 4)
+
+
+def test_apply_moves_batch_matches_apply_move():
+    """Batch children equal apply_move() over every legal move, both players."""
+    frontier = [create_starting_state(num_pits=3, num_seeds=3)]
+    for _ in range(5):
+        frontier = [apply_move(p, m) for p in frontier for m in generate_legal_moves(p)]
+
+    boards = np.array([s.board for s in frontier])
+    players = np.array([s.player for s in frontier])
+    child_boards, child_players = apply_moves_batch(boards, players, num_pits=3)
+
+    expected = sorted(
+        (child.board, child.player)
+        for parent in frontier
+        for child in (apply_move(parent, m) for m in generate_legal_moves(parent))
+    )
+    actual = sorted(zip(map(tuple, child_boards.tolist()), child_players.tolist()))
+    assert actual == expected